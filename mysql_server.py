@@ -7,53 +7,177 @@ Official implementation using MCP Python SDK with FastMCP.
 Provides only database operations as MCP tools:
 
 TOOLS:
-- query_data: Execute safe database queries (SELECT only)
+- query_data: Execute safe database queries (SELECT, SHOW, DESCRIBE, EXPLAIN)
 - execute_write: Execute write queries (INSERT, UPDATE, DELETE) with transaction support
 - list_tables: List available tables
 - get_schema: Get table schema information
+- get_schemas: Get schemas of several tables in one round-trip
+- batch_query: Execute several SELECT queries concurrently
 
 RESOURCES:
 - mysql://status: Server health check
 - mysql://tables: Tables list
+- mysql://cache/clear: Invalidate the query result cache
 
 Transport: stdio, sse, streamable-http
 """
 
+import argparse
 import asyncio
+import atexit
 import os
+import sys
 import logging
-from typing import List, Optional, Any, Dict
+import re
+import signal
+import time
+from typing import List, Literal, NamedTuple, Optional, Any, Dict, Tuple
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
+from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 import aiomysql
 
 # === CONFIGURATION ===
 from dotenv import load_dotenv
-load_dotenv()
 
-# Environment variables
-db_host = os.getenv('DB_HOST', 'localhost')
-db_port = int(os.getenv('DB_PORT', '3306'))
-db_user = os.getenv('DB_USER', 'root')
-db_password = os.getenv('DB_PASSWORD', '')
-db_name = os.getenv('DB_NAME')  # Optional - server can start without default database
-debug_mode = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+# .env is a local-development convenience. Containers inject the environment
+# directly and skip the file lookup with MCP_MYSQL_SKIP_DOTENV=1; DOTENV_PATH
+# points at a specific file (default: .env in the working directory, then next
+# to this script).
+if os.getenv('MCP_MYSQL_SKIP_DOTENV') != '1':
+    _dotenv_candidates = (
+        [Path(os.environ['DOTENV_PATH'])] if os.getenv('DOTENV_PATH')
+        else [Path('.env'), Path(__file__).resolve().parent / '.env']
+    )
+    for _dotenv_path in _dotenv_candidates:
+        if _dotenv_path.is_file():
+            load_dotenv(_dotenv_path)
+            break
+
+@dataclass(frozen=True, slots=True)
+class DbConfig:
+    """Server configuration, read from the environment once at import."""
+    host: str
+    port: int
+    user: str
+    password: str
+    database: Optional[str]  # Optional - server can start without default database
+    debug: bool
+    pool_min: int
+    pool_max: int
+    pool_recycle: int  # seconds, -1 disables recycling
+    connect_timeout: int  # seconds
+    query_cache_size: int
+    query_cache_ttl: float  # seconds, 0 disables the cache
+    schema_cache_ttl: float  # seconds, 0 disables the cache
+
+@lru_cache(maxsize=1)
+def _load_cfg() -> DbConfig:
+    """Parse environment variables into a DbConfig."""
+    return DbConfig(
+        host=os.getenv('DB_HOST', 'localhost'),
+        port=int(os.getenv('DB_PORT', '3306')),
+        user=os.getenv('DB_USER', 'root'),
+        password=os.getenv('DB_PASSWORD', ''),
+        database=os.getenv('DB_NAME'),
+        debug=os.getenv('DEBUG_MODE', 'false').lower() == 'true',
+        pool_min=int(os.getenv('DB_POOL_MIN', '5')),
+        pool_max=int(os.getenv('DB_POOL_MAX', '20')),
+        pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '3600')),
+        connect_timeout=int(os.getenv('DB_CONNECT_TIMEOUT', '5')),
+        query_cache_size=int(os.getenv('QUERY_CACHE_SIZE', '512')),
+        query_cache_ttl=float(os.getenv('QUERY_CACHE_TTL', '60')),
+        schema_cache_ttl=float(os.getenv('SCHEMA_CACHE_TTL', '300')),
+    )
+
+CFG = _load_cfg()
+
+# Active database - starts at DB_NAME, switched at runtime by change_database
+db_name = CFG.database
+
+def refresh_cfg() -> DbConfig:
+    """Re-read configuration from the environment (for tests)."""
+    global CFG, db_name
+    _load_cfg.cache_clear()
+    CFG = _load_cfg()
+    db_name = CFG.database
+    return CFG
+
+# Streaming (server-side cursor) settings for query_data
+STREAM_CHUNK_SIZE = 1000
+STREAM_AUTO_LIMIT = 5000  # limits above this stream automatically
+MAX_QUERY_LIMIT = 100_000
 
 # Logging setup - CRITICAL: Must write to stderr for STDIO transport
-import sys
 logging.basicConfig(
-    level=logging.DEBUG if debug_mode else logging.INFO,
+    level=logging.DEBUG if CFG.debug else logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     stream=sys.stderr,  # Explicitly write to stderr for STDIO compatibility
     force=True
 )
 logger = logging.getLogger("mysql-mcp")
 
+# Failures a tool reports back as an error response: driver/server errors and
+# network errors. Anything else is a bug and propagates to FastMCP; cancellation
+# (a BaseException) is never swallowed.
+DB_ERRORS = (aiomysql.Error, OSError)
+# Raised by the driver's client-side %-formatting when caller params do not
+# fit the query's placeholders (wrong count, a literal '%' not written as '%%')
+PARAM_ERRORS = (ValueError, TypeError)
+
+def _err(op: str, db: Optional[str], exc: BaseException) -> str:
+    """Log a failed tool operation as key=value fields and return the error message for the response."""
+    logger.error("❌ op=%s db=%s err=%s: %s", op, db, type(exc).__name__, exc, exc_info=CFG.debug)
+    return f"{op} failed: {type(exc).__name__}: {exc}"
+
+# Canonical text for statements issued on every call of a tool. Values are
+# always bound parameters, so the server sees one identical statement text.
+_SQL_LIST_TABLES = "SELECT TABLE_NAME FROM information_schema.tables WHERE table_schema=%s ORDER BY TABLE_NAME"
+_SQL_LIST_DATABASES = (
+    "SELECT SCHEMA_NAME FROM information_schema.schemata "
+    "WHERE SCHEMA_NAME NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys') "
+    "ORDER BY SCHEMA_NAME"
+)
+_SQL_SCHEMA = (
+    "SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA, COLUMN_COMMENT "
+    "FROM information_schema.columns WHERE table_schema=%s AND table_name=%s "
+    "ORDER BY ORDINAL_POSITION"
+)
+_SQL_TABLE_COMMENT = "SELECT TABLE_COMMENT FROM information_schema.tables WHERE table_schema=%s AND table_name=%s"
+# Multi-table variants; "{tables}" is replaced by one %s placeholder per table
+_SQL_SCHEMAS = (
+    "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA, COLUMN_COMMENT "
+    "FROM information_schema.columns WHERE table_schema=%s AND table_name IN ({tables}) "
+    "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+)
+_SQL_TABLE_COMMENTS = (
+    "SELECT TABLE_NAME, TABLE_COMMENT FROM information_schema.tables "
+    "WHERE table_schema=%s AND table_name IN ({tables})"
+)
+
 # === GLOBAL CONTEXT ===
-_global_context: Optional['MysqlContext'] = None
+# One pool per database, created on first use and shared for the process
+# lifetime. Key None is the pool without a default schema (no DB_NAME set).
+_pools: "OrderedDict[Optional[str], aiomysql.Pool]" = OrderedDict()  # least recently used first
+# Pool creations in flight, one per database - concurrent first calls for the
+# same database share it, other databases are not held up by a slow connect
+_pending_pools: "Dict[Optional[str], asyncio.Future[aiomysql.Pool]]" = {}
+
+# Pools for databases other than the configured default serve occasional
+# per-query use: they get a smaller connection cap, and the registry closes the
+# least recently used idle pool once it holds MAX_POOLS - worst case
+# DB_POOL_MAX + (MAX_POOLS - 1) * OTHER_POOL_MAX connections (55 by default)
+OTHER_POOL_MAX = 5
+MAX_POOLS = 8
+
+# Valid MySQL database name: 1-64 characters, no path separators, '.' or NUL
+# and no trailing space. Checked once per name, before a pool is created for it.
+_IDENT_RE = re.compile(r'[^/\\.\x00]{0,63}[^/\\.\x00 ]')
 
 @dataclass
 class MysqlContext:
@@ -62,80 +186,496 @@ class MysqlContext:
 
 async def cleanup_global_context():
     """Cleanup global context and close all connections."""
-    global _global_context
-    if _global_context is not None:
+    if _pools:
         logger.info("🧹 Cleaning up global MySQL context...")
-        _global_context.pool.close()
-        await _global_context.pool.wait_closed()
-        _global_context = None
+        pools = list(_pools.values())
+        _pools.clear()
+        for pool in pools:
+            pool.close()
+        for pool in pools:
+            await pool.wait_closed()
         logger.info("✅ Global context cleaned up")
 
+def _pool_kwargs(database: Optional[str]) -> Dict[str, Any]:
+    """Connection pool settings for a database (None = no default schema)."""
+    return {
+        'host': CFG.host,
+        'port': CFG.port,
+        'user': CFG.user,
+        'password': CFG.password,
+        'db': database,
+        'charset': 'utf8mb4',
+        'autocommit': True,
+        # Only the configured default database pre-opens connections; pools for
+        # other databases connect on demand
+        'minsize': CFG.pool_min if database == CFG.database else 0,
+        'maxsize': CFG.pool_max if database == CFG.database else min(CFG.pool_max, OTHER_POOL_MAX),
+        # Recycle before the server's wait_timeout drops idle connections and
+        # fail fast on network stalls instead of hanging a tool call
+        'pool_recycle': CFG.pool_recycle,
+        'connect_timeout': CFG.connect_timeout
+    }
+
+async def _evict_idle_pools() -> None:
+    """Close least recently used idle pools until the registry has room for one more."""
+    for key in list(_pools):
+        if len(_pools) < MAX_POOLS:
+            return
+        pool = _pools.get(key)
+        # The default and the active database stay; a pool with connections in
+        # use (or being opened) is skipped, so the bound is soft under load.
+        # Tools only reach a pool through _connection(), which acquires right
+        # after the lookup without suspending, so an idle pool has no holder
+        # waiting to acquire from it
+        if pool is None or key in (CFG.database, db_name) or pool.size != pool.freesize:
+            continue
+        del _pools[key]
+        pool.close()
+        await pool.wait_closed()
+        logger.info("🧹 Closed idle MySQL pool for database: %s", key)
+
+@asynccontextmanager
+async def _connection(database_name: Optional[str] = None) -> AsyncIterator[aiomysql.Connection]:
+    """Acquire a pooled connection for a database (active database by default)."""
+    # No await between the lookup and acquire - see _evict_idle_pools
+    pool = await get_pool(database_name)
+    async with pool.acquire() as conn:
+        yield conn
+
 @asynccontextmanager
 async def get_context(database_name: Optional[str] = None) -> AsyncIterator[MysqlContext]:
-    """Get or create MySQL context, optionally for a specific database."""
-    global _global_context
+    """Get MySQL context for a specific database or the active one.
     
-    # If specific database requested, create a temporary context
-    if database_name and database_name != db_name:
-        logger.info(f"🔄 Creating temporary context for database: {database_name}")
-        
-        pool = await aiomysql.create_pool(
-            host=db_host,
-            port=db_port,
-            user=db_user,
-            password=db_password,
-            db=database_name,
-            charset='utf8mb4',
-            autocommit=True,
-            minsize=1,
-            maxsize=5
-        )
-        
-        temp_context = MysqlContext(pool=pool)
+    Kept for the test scripts; the tools use _connection().
+    """
+    yield MysqlContext(pool=await get_pool(database_name))
+
+async def get_pool(database_name: Optional[str] = None) -> aiomysql.Pool:
+    """Return the pool for a database (active database by default), creating it on first use."""
+    key = database_name or db_name
+    pool = _pools.get(key)
+    if pool is not None:
+        _pools.move_to_end(key)
+        return pool
+    
+    if key is not None and not _IDENT_RE.fullmatch(key):
+        # Same error MySQL reports (ER_WRONG_DB_NAME), so tools handle it like any DB error
+        raise aiomysql.ProgrammingError(1102, f"Incorrect database name '{key}'")
+    
+    # Concurrent first calls (e.g. a burst of tool calls at startup) must not
+    # each create a pool - they all wait for the one creation in flight
+    created = False
+    while True:
+        pending = _pending_pools.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(_create_pool(key))
+            _pending_pools[key] = pending
+            pending.add_done_callback(lambda done: _pending_done(key, done))
+            created = True
+        # shield: a cancelled caller must not cancel the creation others wait on
+        await asyncio.shield(pending)
+        # Re-read the registry - returning the pool straight from the future
+        # would hand out one evicted while this caller was waking up
+        pool = _pools.get(key)
+        if pool is not None:
+            break
+    
+    if created and key is not None and key == db_name:
+        await _prewarm_tables_cache(pool, key)
+    
+    return pool
+
+def _pending_done(key: Optional[str], done: "asyncio.Future[aiomysql.Pool]") -> None:
+    """Forget a finished pool creation so a failed one is retried on the next call."""
+    if _pending_pools.get(key) is done:
+        del _pending_pools[key]
+    if not done.cancelled():
+        done.exception()  # retrieved here in case every waiter was cancelled
+
+async def _create_pool(key: Optional[str]) -> aiomysql.Pool:
+    """Create, check and register the pool for a database."""
+    if key is None:
+        # If no default database is set and no specific database requested, connect without DB
+        logger.info("🔄 Initializing MySQL context without default database...")
+    else:
+        logger.info("🔄 Initializing MySQL pool for database: %s...", key)
+    await _evict_idle_pools()
+    pool = await aiomysql.create_pool(**_pool_kwargs(key))
+    if not pool.freesize:
+        # Pools with minsize=0 open no connection on creation - connect once
+        # before publishing the pool, so concurrent callers never pick up a
+        # pool for an unknown or unreachable database
         try:
-            yield temp_context
-        finally:
+            async with pool.acquire():
+                pass
+        except BaseException:
             pool.close()
             await pool.wait_closed()
-        return
+            raise
+    _pools[key] = pool
+    logger.info("✅ MySQL context initialized")
+    return pool
+
+_active_sessions = 0
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Create the MySQL pool eagerly when an MCP session starts and close it
+    when the last session ends. SSE/HTTP transports enter the lifespan once
+    per client session, so the pool is shared and reference counted.
+    """
+    global _active_sessions
     
-    # Use or create global context
-    if _global_context is None:
-        if db_name is None:
-            # If no default database is set and no specific database requested, connect without DB
-            logger.info("🔄 Initializing MySQL context without default database...")
-            pool = await aiomysql.create_pool(
-                host=db_host,
-                port=db_port,
-                user=db_user,
-                password=db_password,
-                charset='utf8mb4',
-                autocommit=True,
-                minsize=1,
-                maxsize=10
-            )
-        else:
-            # Connect to default database
-            logger.info(f"🔄 Initializing MySQL context with default database: {db_name}...")
-            pool = await aiomysql.create_pool(
-                host=db_host,
-                port=db_port,
-                user=db_user,
-                password=db_password,
-                db=db_name,
-                charset='utf8mb4',
-                autocommit=True,
-                minsize=1,
-                maxsize=10
-            )
-        
-        _global_context = MysqlContext(pool=pool)
-        logger.info("✅ MySQL context initialized")
+    _active_sessions += 1
+    try:
+        await get_pool()
+    except DB_ERRORS as e:
+        # Server must start even when MySQL is down - the pool is retried on first use
+        logger.warning("⚠️ MySQL pool not created at startup: %s", e)
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            await cleanup_global_context()
+
+# === QUERY CLASSIFICATION ===
+# Hand-written scanner instead of regex/substring checks: it skips comments,
+# string literals and quoted identifiers, resolves WITH ... SELECT and
+# parenthesised queries, and only counts a LIMIT at the outermost level.
+READ_ONLY_STATEMENTS = frozenset({'SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN'})
+NO_LIMIT_STATEMENTS = frozenset({'SHOW', 'DESCRIBE', 'EXPLAIN'})
+WRITE_STATEMENTS = frozenset({'INSERT', 'UPDATE', 'DELETE', 'REPLACE'})
+_DML_KEYWORDS = frozenset({'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE'})
+# SHOW variants query_data accepts - schema metadata only, no server or session
+# state (PROCESSLIST, GRANTS, VARIABLES, ...)
+SHOW_METADATA_OBJECTS = frozenset({
+    'TABLES', 'DATABASES', 'SCHEMAS', 'COLUMNS', 'FIELDS', 'INDEX', 'INDEXES', 'KEYS',
+    'CREATE TABLE', 'CREATE VIEW', 'TABLE STATUS'
+})
+
+class QueryInfo(NamedTuple):
+    """Result of scanning a SQL string."""
+    statement: str  # leading statement keyword, e.g. SELECT; '' if none
+    has_limit: bool  # LIMIT present at the outermost level
+    multi_statement: bool  # more SQL follows a ';'
+    limit_pos: int  # where a LIMIT clause belongs (before FOR UPDATE / LOCK IN SHARE MODE)
+    body_end: int  # end of the statement, without trailing ';' and comments
+    has_into: bool  # INTO at the outermost level (SELECT ... INTO OUTFILE/DUMPFILE/@var)
+    show_object: str  # what a SHOW lists, e.g. TABLES or CREATE TABLE; '' if not SHOW
+    exec_comment: bool  # contains a /*! ... */ or /*M! ... */ comment, which MySQL executes
+
+Word = Tuple[str, int, int]  # (UPPERCASE word, paren depth, start offset)
+
+def _scan_words(query: str) -> Tuple[List[Word], bool, int, bool]:
+    """
+    Split SQL into word tokens, detect trailing statements, find the end of the
+    statement body and flag executable comments.
+    """
+    words: List[Word] = []
+    depth = 0
+    terminated = False
+    exec_comment = False
+    body_end = 0
+    i = 0
+    length = len(query)
+    while i < length:
+        ch = query[i]
+        if ch in "'\"`":
+            if terminated:
+                return words, True, body_end, exec_comment
+            # String literal or quoted identifier; doubled quote or backslash escapes
+            i += 1
+            while i < length:
+                if query[i] == '\\' and ch != '`':
+                    i += 2
+                    continue
+                if query[i] == ch:
+                    if i + 1 < length and query[i + 1] == ch:
+                        i += 2
+                        continue
+                    break
+                i += 1
+            i = min(i + 1, length)
+            body_end = i
+            continue
+        if ch == '#' or (ch == '-' and query.startswith('--', i) and (i + 2 >= length or query[i + 2] in ' \t\r\n')):
+            newline = query.find('\n', i)
+            i = length if newline == -1 else newline + 1
+            continue
+        if ch == '/' and query.startswith('/*', i):
+            # /*! ... */ and /*M! ... */ are run by the server, not ignored - they are
+            # skipped like any comment but flagged, so callers can reject the query
+            exec_comment = exec_comment or query.startswith(('/*!', '/*M!'), i)
+            close = query.find('*/', i + 2)
+            i = length if close == -1 else close + 2
+            continue
+        if ch.isspace():
+            i += 1
+            continue
+        if ch == ';':
+            terminated = True
+            i += 1
+            continue
+        if terminated:
+            return words, True, body_end, exec_comment
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch.isalpha() or ch == '_':
+            start = i
+            while i < length and (query[i].isalnum() or query[i] in '_$'):
+                i += 1
+            words.append((query[start:i].upper(), depth, start))
+            body_end = i
+            continue
+        i += 1
+        body_end = i
+    return words, False, body_end, exec_comment
+
+def _statement_type(words: List[Word], start: int = 0) -> str:
+    """Resolve the statement keyword at words[start], following WITH and EXPLAIN/DESCRIBE."""
+    if start >= len(words):
+        return ''
+    first, first_depth, _ = words[start]
+    if first == 'WITH':
+        # The main statement is the first DML keyword back at the WITH level
+        for word, depth, _ in words[start + 1:]:
+            if depth == first_depth and word in _DML_KEYWORDS:
+                return word
+        return 'WITH'
+    if first in ('EXPLAIN', 'DESCRIBE', 'DESC'):
+        # EXPLAIN ANALYZE executes the statement - classify by what is explained
+        for index in range(start + 1, len(words)):
+            word = words[index][0]
+            if word in _DML_KEYWORDS or word == 'WITH':
+                explained = _statement_type(words, index)
+                return 'EXPLAIN' if explained == 'SELECT' else explained
+        return 'DESCRIBE' if first != 'EXPLAIN' else 'EXPLAIN'
+    return first
+
+def _show_object(words: List[Word]) -> str:
+    """Name what a SHOW statement lists (FULL / EXTENDED modifiers skipped); '' for other statements."""
+    if not words or words[0][0] != 'SHOW':
+        return ''
+    names = [word for word, _, _ in words[1:] if word not in ('FULL', 'EXTENDED')]
+    if not names:
+        return ''
+    if names[0] in ('CREATE', 'TABLE') and len(names) > 1:
+        return f"{names[0]} {names[1]}"
+    return names[0]
+
+@lru_cache(maxsize=256)
+def _classify_query(query: str) -> QueryInfo:
+    """Classify a SQL string once; results are memoized on the query text."""
+    words, multi_statement, body_end, exec_comment = _scan_words(query)
+    statement = _statement_type(words)
+    outer_depth = min((depth for _, depth, _ in words), default=0)
+    outer = [(word, offset) for word, depth, offset in words if depth == outer_depth]
+    has_limit = any(word == 'LIMIT' for word, _ in outer)
     
-    yield _global_context
+    # Locking clauses must follow LIMIT: SELECT ... LIMIT n FOR UPDATE
+    limit_pos = body_end
+    for index, (word, offset) in enumerate(outer[:-1]):
+        following = outer[index + 1][0]
+        if (word == 'FOR' and following in ('UPDATE', 'SHARE')) or (word == 'LOCK' and following == 'IN'):
+            limit_pos = offset
+            break
+    has_into = any(word == 'INTO' for word, _ in outer)
+    return QueryInfo(
+        statement, has_limit, multi_statement, limit_pos, body_end, has_into, _show_object(words), exec_comment
+    )
+
+@lru_cache(maxsize=256)
+def _apply_limit(query: str) -> str:
+    """
+    Insert a "LIMIT %s" placeholder into a SELECT lacking one. Trailing ';' and
+    comments are dropped and '%' is escaped, as the query is run with bound args.
+    Built once per query text from the memoized classification.
+    """
+    query_info = _classify_query(query)
+    head = query[:query_info.limit_pos].rstrip().replace('%', '%%')
+    tail = query[query_info.limit_pos:query_info.body_end].replace('%', '%%')
+    return f"{head} LIMIT %s {tail}".rstrip()
+
+# Common SHOW statements and their information_schema equivalents, which -
+# unlike SHOW - accept LIMIT, so only the requested rows cross the wire
+_IDENT = r'(`(?:[^`]|``)+`|[\w$]+)'
+_SHOW_TABLES_RE = re.compile(r'SHOW\s+TABLES', re.IGNORECASE)
+_SHOW_DATABASES_RE = re.compile(r'SHOW\s+(?:DATABASES|SCHEMAS)', re.IGNORECASE)
+_SHOW_COLUMNS_RE = re.compile(
+    rf'SHOW\s+(?:COLUMNS|FIELDS)\s+(?:FROM|IN)\s+{_IDENT}(?:\s+(?:FROM|IN)\s+{_IDENT})?',
+    re.IGNORECASE
+)
+_SQL_SHOW_DATABASES_LIMITED = (
+    "SELECT SCHEMA_NAME AS `Database` FROM information_schema.schemata ORDER BY SCHEMA_NAME LIMIT %s"
+)
+_SQL_SHOW_COLUMNS_LIMITED = (
+    "SELECT COLUMN_NAME AS `Field`, COLUMN_TYPE AS `Type`, IS_NULLABLE AS `Null`, COLUMN_KEY AS `Key`, "
+    "COLUMN_DEFAULT AS `Default`, EXTRA AS `Extra` FROM information_schema.columns "
+    "WHERE table_schema=%s AND table_name=%s ORDER BY ORDINAL_POSITION LIMIT %s"
+)
+
+def _unquote_ident(identifier: str) -> str:
+    """Strip backtick quoting from an identifier."""
+    if identifier.startswith('`'):
+        return identifier[1:-1].replace('``', '`')
+    return identifier
+
+def _rewrite_show(query: str, query_info: QueryInfo, database: Optional[str]) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+    """
+    Translate SHOW TABLES / SHOW DATABASES / SHOW COLUMNS into an information_schema
+    SELECT ending in "LIMIT %s". Returns (sql, args without the limit), or None for
+    other SHOW variants, which are run as-is and truncated client-side.
+    """
+    body = query[:query_info.body_end].strip()
+    if _SHOW_DATABASES_RE.fullmatch(body):
+        return _SQL_SHOW_DATABASES_LIMITED, ()
+    if database is None:
+        # SHOW TABLES / COLUMNS without a schema fail server-side; keep MySQL's error
+        return None
+    if _SHOW_TABLES_RE.fullmatch(body):
+        alias = f"Tables_in_{database}".replace('`', '``').replace('%', '%%')
+        return (
+            f"SELECT TABLE_NAME AS `{alias}` FROM information_schema.tables WHERE table_schema=%s ORDER BY TABLE_NAME LIMIT %s",
+            (database,)
+        )
+    match = _SHOW_COLUMNS_RE.fullmatch(body)
+    if match:
+        table = _unquote_ident(match.group(1))
+        schema = _unquote_ident(match.group(2)) if match.group(2) else database
+        return _SQL_SHOW_COLUMNS_LIMITED, (schema, table)
+    return None
+
+def _column_names(cursor: aiomysql.Cursor) -> List[str]:
+    """
+    Result column names, made unique the same way aiomysql's DictCursor does:
+    a repeated name (e.g. id from both sides of a JOIN) becomes table.name.
+    """
+    fields = getattr(getattr(cursor, '_result', None), 'fields', None)
+    if not fields:
+        return [desc[0] for desc in cursor.description] if cursor.description else []
+    names: List[str] = []
+    for field in fields:
+        name = field.name
+        if name in names:
+            name = f"{field.table_name}.{name}"
+        names.append(name)
+    return names
+
+# === QUERY RESULT CACHE ===
+# LRU + TTL cache of successful query_data results, keyed on (query, limit, database, format).
+# The query text is only stripped - lowercasing or collapsing whitespace would
+# conflate distinct string literals ('Bob' vs 'bob').
+QueryCacheKey = Tuple[str, int, Optional[str], str]
+_query_cache: "OrderedDict[QueryCacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+def _query_cache_get(key: QueryCacheKey) -> Optional[Dict[str, Any]]:
+    """Return a cached query result if present and not expired."""
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at >= CFG.query_cache_ttl:
+        del _query_cache[key]
+        return None
+    _query_cache.move_to_end(key)
+    return result
+
+def _query_cache_put(key: QueryCacheKey, result: Dict[str, Any]) -> None:
+    """Store a query result, evicting the least recently used entry when full."""
+    if CFG.query_cache_ttl <= 0 or CFG.query_cache_size <= 0:
+        return
+    _query_cache[key] = (time.monotonic(), result)
+    _query_cache.move_to_end(key)
+    while len(_query_cache) > CFG.query_cache_size:
+        _query_cache.popitem(last=False)
+
+def clear_query_cache() -> int:
+    """Drop all cached query results. Returns number of evicted entries."""
+    count = len(_query_cache)
+    _query_cache.clear()
+    return count
+
+# === SCHEMA CACHE ===
+# Schema changes are rare compared to tool-call frequency, so table lists
+# (per database) and table schemas (per database + table) are cached with a TTL.
+_tables_cache: Dict[str, Tuple[float, List[str]]] = {}
+_table_sets: Dict[str, frozenset] = {}  # lowercased table names, allow-list for get_schema
+_schema_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+def _schema_cache_fresh(stored_at: float) -> bool:
+    """Check whether a schema cache entry is still within its TTL."""
+    return time.monotonic() - stored_at < CFG.schema_cache_ttl
+
+def _store_tables(database: str, tables: List[str]) -> None:
+    """Cache a table list together with its lookup set."""
+    if CFG.schema_cache_ttl <= 0:
+        return
+    _tables_cache[database] = (time.monotonic(), tables)
+    # Case-insensitive so servers with lower_case_table_names=1/2 are not rejected
+    _table_sets[database] = frozenset(table.lower() for table in tables)
+
+async def _prewarm_tables_cache(pool: aiomysql.Pool, database: str) -> None:
+    """Fill the tables cache for the default database right after pool creation."""
+    if CFG.schema_cache_ttl <= 0:
+        return
+    try:
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(_SQL_LIST_TABLES, (database,))
+                rows = await cursor.fetchall()
+        _store_tables(database, [row[0] for row in rows])
+        logger.debug("Prewarmed tables cache for %s", database)
+    except DB_ERRORS as e:
+        logger.warning("⚠️ Failed to prewarm tables cache for %s: %s", database, e)
+
+async def _fetch_cols(database: str, table_name: str) -> List[Dict[str, Any]]:
+    """Read column definitions and comments for a table."""
+    async with _connection(database) as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(_SQL_SCHEMA, (database, table_name))
+            return await cursor.fetchall()
+
+async def _fetch_comment(database: str, table_name: str) -> str:
+    """Read the table comment for a table."""
+    async with _connection(database) as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(_SQL_TABLE_COMMENT, (database, table_name))
+            row = await cursor.fetchone()
+            return row[0] if row else ""
+
+def _schema_result(table_name: str, database: str, columns: List[Dict[str, Any]], table_comment: str) -> Dict[str, Any]:
+    """Build a get_schema response from information_schema column rows and cache it."""
+    schema_info = []
+    for col in columns:
+        schema_info.append({
+            "field": col["COLUMN_NAME"],
+            "type": col["COLUMN_TYPE"],
+            "null": col["IS_NULLABLE"],
+            "key": col["COLUMN_KEY"],
+            "default": col["COLUMN_DEFAULT"],
+            "extra": col["EXTRA"],
+            "comment": col["COLUMN_COMMENT"]
+        })
+    
+    result = {
+        "status": "success",
+        "message": f"Schema for {table_name} retrieved successfully",
+        "table": table_name,
+        "database": database,
+        "table_comment": table_comment,
+        "columns": schema_info,
+        "count": len(schema_info)
+    }
+    if CFG.schema_cache_ttl > 0:
+        _schema_cache[(database, table_name)] = (time.monotonic(), result)
+    return result
 
 # === FASTMCP SERVER ===
-mcp = FastMCP("mysql-mcp-server")
+mcp = FastMCP("mysql-mcp-server", lifespan=lifespan)
 
 # === MCP TOOLS ===
 @mcp.tool()
@@ -149,50 +689,29 @@ async def change_database(database_name: str) -> Dict[str, Any]:
     Returns:
         Status of the database change operation
     """
-    global _global_context, db_name
+    global db_name
     
     try:
-        logger.info(f"🔄 Changing database to: {database_name}")
+        logger.info("🔄 Changing database to: %s", database_name)
         
-        # Close existing pool if exists
-        if _global_context is not None:
-            _global_context.pool.close()
-            await _global_context.pool.wait_closed()
-            _global_context = None
+        # Switching is a pointer swap to the registry pool for that database;
+        # previous pools stay in the registry for later per-query use.
+        # get_pool only registers a new pool once it has connected, so an
+        # unknown or unreachable database fails here
+        await get_pool(database_name)
         
-        # Update global database name
+        # Update global database name; the next mysql://tables read re-lists it
         db_name = database_name
-        
-        # Create new pool with new database
-        pool = await aiomysql.create_pool(
-            host=db_host,
-            port=db_port,
-            user=db_user,
-            password=db_password,
-            db=database_name,
-            charset='utf8mb4',
-            autocommit=True,
-            minsize=1,
-            maxsize=10
-        )
-        
-        _global_context = MysqlContext(pool=pool)
-        
-        # Test connection
-        async with pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute("SELECT DATABASE()")
-                current_db = await cursor.fetchone()
+        _tables_text_cache.pop(database_name, None)
         
         return {
             "status": "success",
             "message": f"Successfully changed to database: {database_name}",
-            "current_database": current_db[0] if current_db else database_name
+            "current_database": database_name
         }
         
-    except Exception as e:
-        error_msg = f"Failed to change database to {database_name}: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+    except DB_ERRORS as e:
+        error_msg = _err("change_database", database_name, e)
         return {
             "status": "error",
             "message": error_msg,
@@ -200,82 +719,169 @@ async def change_database(database_name: str) -> Dict[str, Any]:
         }
 
 @mcp.tool()
-async def query_data(query: str, limit: int = 100, database: Optional[str] = None) -> Dict[str, Any]:
+async def query_data(
+    query: str,
+    limit: int = 100,
+    database: Optional[str] = None,
+    stream: bool = False,
+    format: Literal["records", "rows", "columns"] = "records"
+) -> Dict[str, Any]:
     """
     Execute a SQL query and return the results.
     
     Args:
-        query: SQL query to execute
-        limit: Maximum number of rows to return (default: 100)
+        query: SQL query to execute (SELECT, EXPLAIN, DESCRIBE or a metadata SHOW
+            such as SHOW TABLES / SHOW CREATE TABLE; SELECT ... INTO is rejected)
+        limit: Maximum number of rows to return, 1-100000 (default: 100)
         database: Optional database name to use for this query (uses current if not specified)
+        stream: Read rows through an unbuffered server-side cursor in chunks, keeping
+            driver memory bounded for large reports/exports (enabled automatically
+            when limit exceeds 5000). The connection stays busy until all rows are read.
+        format: Shape of "rows" in the response:
+            - "records": list of {column: value} objects (default)
+            - "rows": list of value arrays in the order of "columns" (compact)
+            - "columns": {column: [values...]} object of arrays (compact)
         
     Returns:
         Dictionary containing query results and metadata
     """
-    logger.info(f"🔍 Executing query with limit {limit}")
-    logger.debug(f"Query: {query}")
+    logger.info("🔍 Executing query with limit %s", limit)
+    logger.debug("Query: %s", query)
     
     try:
-        # Safety check - only allow SELECT queries
-        query_upper = query.strip().upper()
-        if not query_upper.startswith('SELECT'):
+        # Safety check - only allow single read-only queries
+        query_info = _classify_query(query)
+        if query_info.statement not in READ_ONLY_STATEMENTS:
+            return {
+                "success": False,
+                "error": "Only SELECT queries (and SHOW, DESCRIBE, EXPLAIN) are allowed for safety",
+                "query": query,
+                "database": database or "current"
+            }
+        if query_info.statement == 'SHOW' and query_info.show_object not in SHOW_METADATA_OBJECTS:
+            return {
+                "success": False,
+                "error": "Only SHOW statements for schema metadata (TABLES, DATABASES, COLUMNS, INDEX, CREATE TABLE/VIEW, TABLE STATUS) are allowed",
+                "query": query,
+                "database": database or "current"
+            }
+        if query_info.exec_comment:
+            return {
+                "success": False,
+                "error": "Executable comments (/*! ... */) are not allowed",
+                "query": query,
+                "database": database or "current"
+            }
+        if query_info.has_into:
+            # SELECT ... INTO writes a file on the server or sets variables
+            return {
+                "success": False,
+                "error": "SELECT ... INTO is not allowed",
+                "query": query,
+                "database": database or "current"
+            }
+        if query_info.multi_statement:
+            return {
+                "success": False,
+                "error": "Multiple statements are not allowed",
+                "query": query,
+                "database": database or "current"
+            }
+        
+        if not 1 <= limit <= MAX_QUERY_LIMIT:
+            return {
+                "success": False,
+                "error": f"limit must be between 1 and {MAX_QUERY_LIMIT}",
+                "query": query,
+                "database": database or "current"
+            }
+        if format not in ("records", "rows", "columns"):
             return {
                 "success": False,
-                "error": "Only SELECT queries are allowed for safety",
+                "error": f"Unknown format '{format}', use 'records', 'rows' or 'columns'",
                 "query": query,
                 "database": database or "current"
             }
         
+        cache_key = (query.strip(), limit, database or db_name, format)
+        cached = _query_cache_get(cache_key)
+        if cached is not None:
+            logger.info("⚡ Query served from cache (%s rows)", cached['row_count'])
+            return cached
+        
         # Use specific database for this query or fall back to global
-        async with get_context(database) as ctx:
-            async with ctx.pool.acquire() as conn:
-                # Switch to specific database for this connection if provided
-                if database:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(f"USE `{database}`")
-                
-                async with conn.cursor(aiomysql.DictCursor) as cursor:
-                    # Add LIMIT clause if not present and limit is specified
-                    # But don't add LIMIT to SHOW commands as they don't support it
-                    query_upper = query.upper().strip()
-                    if (limit > 0 and 
-                        "LIMIT" not in query_upper and 
-                        not query_upper.startswith("SHOW") and
-                        not query_upper.startswith("DESCRIBE") and
-                        not query_upper.startswith("EXPLAIN")):
-                        query = f"{query.rstrip(';')} LIMIT {limit}"
-                    
+        async with _connection(database) as conn:
+            # A LIMIT written by the caller may exceed `limit` - stream those
+            # SELECTs so reading stops at the cap instead of buffering everything
+            caller_limit = query_info.statement == 'SELECT' and query_info.has_limit
+            use_stream = stream or limit > STREAM_AUTO_LIMIT or caller_limit
+            # Rows are always read as plain tuples; per-row dicts are only
+            # built for the "records" format once the result is final
+            cursor_class = aiomysql.SSCursor if use_stream else aiomysql.Cursor
+            
+            async with conn.cursor(cursor_class) as cursor:
+                # Add LIMIT clause if not present and limit is specified
+                # But don't add LIMIT to SHOW commands as they don't support it
+                is_show = query_info.statement in NO_LIMIT_STATEMENTS
+                show_rewrite = None
+                if query_info.statement == 'SHOW':
+                    show_rewrite = _rewrite_show(query, query_info, database or db_name)
+                if show_rewrite is not None:
+                    # Push the limit into SQL instead of slicing a full SHOW result
+                    show_sql, show_args = show_rewrite
+                    query = cursor.mogrify(show_sql, show_args + (limit,))
+                    await cursor.execute(show_sql, show_args + (limit,))
+                elif not is_show and not query_info.has_limit:
+                    # Bound parameter keeps the statement text identical across limits
+                    limited_query = _apply_limit(query)
+                    await cursor.execute(limited_query, (limit,))
+                    query = limited_query % (limit,)
+                else:
                     await cursor.execute(query)
-                    rows = await cursor.fetchall()
-                    
-                    # If it's a SHOW command and limit is specified, manually limit results
-                    if query_upper.startswith("SHOW") and limit > 0:
-                        rows = rows[:limit]
-                    
-                    # Get column information
-                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                    
-                    # Get current database using a regular cursor
-                    async with conn.cursor() as db_cursor:
-                        await db_cursor.execute("SELECT DATABASE()")
-                        current_db = await db_cursor.fetchone()
-                        current_database = current_db[0] if current_db and len(current_db) > 0 else database or "unknown"
-                    
-                    result = {
-                        "success": True,
-                        "rows": rows,
-                        "row_count": len(rows),
-                        "columns": columns,
-                        "database": current_database,
-                        "query": query
-                    }
-                    
-                    logger.info(f"✅ Query executed successfully. Returned {len(rows)} rows from database '{current_database}'")
-                    return result
+                # Every result is capped at `limit` while reading - SHOW/DESCRIBE
+                # have no LIMIT in SQL and a caller's own LIMIT may be larger:
+                # a streamed result stops at the limit (the driver discards the
+                # rest on close without building rows), a buffered one is cut
+                # by fetchmany instead of slicing a fetchall() copy
+                if use_stream:
+                    rows = []
+                    while len(rows) < limit:
+                        chunk = await cursor.fetchmany(min(STREAM_CHUNK_SIZE, limit - len(rows)))
+                        if not chunk:
+                            break
+                        rows.extend(chunk)
+                else:
+                    rows = await cursor.fetchmany(limit)
                 
-    except Exception as e:
-        error_msg = f"Query failed: {type(e).__name__}: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+                # Get column information
+                columns = _column_names(cursor)
+                if format == "records":
+                    data: Any = [dict(zip(columns, row)) for row in rows]
+                elif format == "columns":
+                    values = list(zip(*rows)) if rows else [()] * len(columns)
+                    data = {column: list(column_values) for column, column_values in zip(columns, values)}
+                else:
+                    data = rows
+                
+                # The pool is bound to this database - no SELECT DATABASE() round-trip
+                current_database = database or db_name or "unknown"
+                
+                result = {
+                    "success": True,
+                    "rows": data,
+                    "row_count": len(rows),
+                    "columns": columns,
+                    "format": format,
+                    "database": current_database,
+                    "query": query
+                }
+                
+                _query_cache_put(cache_key, result)
+                logger.info("✅ Query executed successfully. Returned %s rows from database '%s'", len(rows), current_database)
+                return result
+            
+    except DB_ERRORS as e:
+        error_msg = _err("query_data", database or db_name, e)
         return {
             "success": False,
             "error": error_msg,
@@ -292,24 +898,42 @@ async def execute_write(query: str, params: Optional[List[Any]] = None, database
 
     Args:
         query: SQL write query to execute (INSERT, UPDATE, DELETE)
-        params: Optional list of parameters for parameterized queries (prevents SQL injection)
+        params: Optional list of parameters for parameterized queries (prevents SQL injection).
+            A list of lists runs the query once per inner list in the same transaction;
+            INSERT/REPLACE ... VALUES is sent as a single multi-row statement
         database: Optional database name to use for this query (uses current if not specified)
 
     Returns:
         Dictionary containing execution result with affected_rows and last_insert_id
     """
     logger.info("✏️ Executing write query")
-    logger.debug(f"Query: {query}")
-
-    ALLOWED_PREFIXES = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+    logger.debug("Query: %s", query)
 
     query_stripped = query.strip()
-    query_upper = query_stripped.upper()
+    query_info = _classify_query(query_stripped)
 
-    if not any(query_upper.startswith(prefix) for prefix in ALLOWED_PREFIXES):
+    if query_info.statement not in WRITE_STATEMENTS:
+        return {
+            "success": False,
+            "error": "Only INSERT, UPDATE, DELETE, REPLACE queries are allowed. Use query_data for SELECT.",
+            "query": query,
+            "database": database or "current",
+            "affected_rows": 0,
+            "last_insert_id": None,
+        }
+    if query_info.exec_comment:
+        return {
+            "success": False,
+            "error": "Executable comments (/*! ... */) are not allowed",
+            "query": query,
+            "database": database or "current",
+            "affected_rows": 0,
+            "last_insert_id": None,
+        }
+    if query_info.multi_statement:
         return {
             "success": False,
-            "error": f"Only {', '.join(ALLOWED_PREFIXES)} queries are allowed. Use query_data for SELECT.",
+            "error": "Multiple statements are not allowed",
             "query": query,
             "database": database or "current",
             "affected_rows": 0,
@@ -317,49 +941,44 @@ async def execute_write(query: str, params: Optional[List[Any]] = None, database
         }
 
     try:
-        async with get_context(database) as ctx:
-            async with ctx.pool.acquire() as conn:
-                if database:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(f"USE `{database}`")
-
-                # Disable autocommit to use explicit transaction
-                await conn.begin()
-                try:
-                    async with conn.cursor() as cursor:
-                        if params:
-                            await cursor.execute(query_stripped, params)
-                        else:
-                            await cursor.execute(query_stripped)
-
-                        affected_rows = cursor.rowcount
-                        last_insert_id = cursor.lastrowid
-
-                    await conn.commit()
-
-                    # Resolve current database name for response
-                    async with conn.cursor() as db_cursor:
-                        await db_cursor.execute("SELECT DATABASE()")
-                        current_db_row = await db_cursor.fetchone()
-                        current_database = current_db_row[0] if current_db_row else database or "unknown"
-
-                    logger.info(f"✅ Write query executed successfully. Affected rows: {affected_rows}")
-                    return {
-                        "success": True,
-                        "message": "Query executed successfully",
-                        "query": query_stripped,
-                        "database": current_database,
-                        "affected_rows": affected_rows,
-                        "last_insert_id": last_insert_id if last_insert_id else None,
-                    }
+        async with _connection(database) as conn:
+            # Disable autocommit to use explicit transaction
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    if params and isinstance(params[0], (list, tuple)):
+                        # Batch form - one round-trip for the whole row set
+                        await cursor.executemany(query_stripped, params)
+                    elif params:
+                        await cursor.execute(query_stripped, params)
+                    else:
+                        await cursor.execute(query_stripped)
 
-                except Exception:
-                    await conn.rollback()
-                    raise
+                    affected_rows = cursor.rowcount
+                    last_insert_id = cursor.lastrowid
 
-    except Exception as e:
-        error_msg = f"Write query failed: {type(e).__name__}: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+                await conn.commit()
+                clear_query_cache()
+
+                # The pool is bound to this database - no SELECT DATABASE() round-trip
+                current_database = database or db_name or "unknown"
+
+                logger.info("✅ Write query executed successfully. Affected rows: %s", affected_rows)
+                return {
+                    "success": True,
+                    "message": "Query executed successfully",
+                    "query": query_stripped,
+                    "database": current_database,
+                    "affected_rows": affected_rows,
+                    "last_insert_id": last_insert_id if last_insert_id else None,
+                }
+
+            except Exception:
+                await conn.rollback()
+                raise
+
+    except DB_ERRORS + PARAM_ERRORS as e:
+        error_msg = _err("execute_write", database or db_name, e)
         return {
             "success": False,
             "error": error_msg,
@@ -381,31 +1000,22 @@ async def list_databases() -> Dict[str, Any]:
     try:
         logger.info("📋 Listing available databases...")
         
-        async with get_context() as ctx:
-            async with ctx.pool.acquire() as conn:
-                async with conn.cursor() as cursor:
-                    await cursor.execute("SHOW DATABASES")
-                    rows = await cursor.fetchall()
-                    
-                    # Extract database names, excluding system databases
-                    databases = []
-                    system_dbs = {'information_schema', 'performance_schema', 'mysql', 'sys'}
-                    
-                    for row in rows:
-                        db_name = row[0]
-                        if db_name not in system_dbs:
-                            databases.append(db_name)
-                    
-                    return {
-                        "status": "success",
-                        "message": "Databases retrieved successfully",
-                        "databases": databases,
-                        "count": len(databases)
-                    }
-                    
-    except Exception as e:
-        error_msg = f"Failed to list databases: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+        async with _connection() as conn:
+            async with conn.cursor() as cursor:
+                # System databases are excluded by the server, not shipped and dropped
+                await cursor.execute(_SQL_LIST_DATABASES)
+                rows = await cursor.fetchall()
+                databases = [row[0] for row in rows]
+                
+                return {
+                    "status": "success",
+                    "message": "Databases retrieved successfully",
+                    "databases": databases,
+                    "count": len(databases)
+                }
+                
+    except DB_ERRORS as e:
+        error_msg = _err("list_databases", None, e)
         return {
             "status": "error",
             "message": error_msg,
@@ -414,12 +1024,13 @@ async def list_databases() -> Dict[str, Any]:
         }
 
 @mcp.tool()
-async def list_tables(database: Optional[str] = None) -> Dict[str, Any]:
+async def list_tables(database: Optional[str] = None, refresh: bool = False) -> Dict[str, Any]:
     """
     List all available tables in the specified database.
     
     Args:
         database: Database name to list tables from (required if no default database set)
+        refresh: Bypass the schema cache and re-read the table list from MySQL
         
     Returns:
         List of tables with basic information
@@ -439,37 +1050,39 @@ async def list_tables(database: Optional[str] = None) -> Dict[str, Any]:
                 "count": 0
             }
             
-        logger.info(f"📋 Listing tables in database: {target_db}")
+        cached = _tables_cache.get(target_db)
+        if cached is not None and not refresh and _schema_cache_fresh(cached[0]):
+            tables = cached[1]
+            return {
+                "status": "success",
+                "message": f"Tables retrieved successfully from {target_db}",
+                "database": target_db,
+                "tables": tables,
+                "count": len(tables)
+            }
+            
+        logger.info("📋 Listing tables in database: %s", target_db)
         
-        async with get_context(database) as ctx:
-            async with ctx.pool.acquire() as conn:
-                # Switch to specific database if provided
-                if database:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(f"USE `{database}`")
-                elif db_name:
-                    # Ensure we're using the correct database
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(f"USE `{db_name}`")
+        async with _connection(database) as conn:
+            # Schema is a bound parameter - no USE needed on the pooled connection
+            async with conn.cursor() as cursor:
+                await cursor.execute(_SQL_LIST_TABLES, (target_db,))
+                rows = await cursor.fetchall()
                 
-                async with conn.cursor() as cursor:
-                    await cursor.execute("SHOW TABLES")
-                    rows = await cursor.fetchall()
-                    
-                    # Extract table names
-                    tables = [row[0] for row in rows]
-                    
-                    return {
-                        "status": "success",
-                        "message": f"Tables retrieved successfully from {target_db}",
-                        "database": target_db,
-                        "tables": tables,
-                        "count": len(tables)
-                    }
-                    
-    except Exception as e:
-        error_msg = f"Failed to list tables: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+                # Extract table names
+                tables = [row[0] for row in rows]
+                _store_tables(target_db, tables)
+                
+                return {
+                    "status": "success",
+                    "message": f"Tables retrieved successfully from {target_db}",
+                    "database": target_db,
+                    "tables": tables,
+                    "count": len(tables)
+                }
+                
+    except DB_ERRORS as e:
+        error_msg = _err("list_tables", database or db_name, e)
         return {
             "status": "error",
             "message": error_msg,
@@ -479,13 +1092,14 @@ async def list_tables(database: Optional[str] = None) -> Dict[str, Any]:
         }
 
 @mcp.tool()
-async def get_schema(table_name: str, database: Optional[str] = None) -> Dict[str, Any]:
+async def get_schema(table_name: str, database: Optional[str] = None, refresh: bool = False) -> Dict[str, Any]:
     """
     Get detailed schema information for a specific table.
     
     Args:
         table_name: Name of the table to describe
         database: Database name containing the table (required if no default database set)
+        refresh: Bypass the schema cache and re-read the schema from MySQL
         
     Returns:
         Detailed schema information including columns and comments
@@ -506,62 +1120,51 @@ async def get_schema(table_name: str, database: Optional[str] = None) -> Dict[st
                 "count": 0
             }
             
-        logger.info(f"🔍 Getting schema for table: {table_name} in database: {target_db}")
-        
-        async with get_context(database) as ctx:
-            async with ctx.pool.acquire() as conn:
-                async with conn.cursor(aiomysql.DictCursor) as cursor:
-                    # Get columns and column comments
-                    await cursor.execute(
-                        "SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT, EXTRA, COLUMN_COMMENT "
-                        "FROM information_schema.columns WHERE table_schema=%s AND table_name=%s",
-                        (target_db, table_name)
-                    )
-                    columns = await cursor.fetchall()
-                    
-                    if not columns:
-                        return {
-                            "status": "error",
-                            "message": f"Table '{table_name}' not found in database '{target_db}'",
-                            "table": table_name,
-                            "database": target_db,
-                            "columns": [],
-                            "count": 0
-                        }
-                    
-                    schema_info = []
-                    for col in columns:
-                        schema_info.append({
-                            "field": col["COLUMN_NAME"],
-                            "type": col["COLUMN_TYPE"],
-                            "null": col["IS_NULLABLE"],
-                            "key": col["COLUMN_KEY"],
-                            "default": col["COLUMN_DEFAULT"],
-                            "extra": col["EXTRA"],
-                            "comment": col["COLUMN_COMMENT"]
-                        })
-                    
-                    # Get table comment
-                    await cursor.execute(
-                        "SELECT TABLE_COMMENT FROM information_schema.tables WHERE table_schema=%s AND table_name=%s",
-                        (target_db, table_name)
-                    )
-                    table_row = await cursor.fetchone()
-                    table_comment = table_row["TABLE_COMMENT"] if table_row else ""
-                    
+        cached = _schema_cache.get((target_db, table_name))
+        if cached is not None and not refresh and _schema_cache_fresh(cached[0]):
+            return cached[1]
+            
+        # Reject unknown tables from the cached table list before touching MySQL;
+        # on a miss the list is re-read once in case the table was just created
+        # (only with the schema cache on - otherwise there is no list to check)
+        if CFG.schema_cache_ttl > 0:
+            known_tables = _table_sets.get(target_db)
+            if known_tables is None or table_name.lower() not in known_tables:
+                await list_tables(database=database, refresh=known_tables is not None)
+                known_tables = _table_sets.get(target_db)
+                if known_tables is not None and table_name.lower() not in known_tables:
                     return {
-                        "status": "success",
-                        "message": f"Schema for {table_name} retrieved successfully",
+                        "status": "error",
+                        "message": f"Table '{table_name}' not found in database '{target_db}'",
                         "table": table_name,
                         "database": target_db,
-                        "table_comment": table_comment,
-                        "columns": schema_info,
-                        "count": len(schema_info)
+                        "columns": [],
+                        "count": 0
                     }
-                    
-    except Exception as e:
-        error_msg = f"Failed to get schema for {table_name}: {str(e)}"
-        logger.error(f"❌ {error_msg}")
+            
+        logger.info("🔍 Getting schema for table: %s in database: %s", table_name, target_db)
+        
+        # Columns and table comment are independent lookups, so run them on
+        # two pooled connections concurrently instead of back to back
+        columns, table_comment = await asyncio.gather(
+            _fetch_cols(target_db, table_name),
+            _fetch_comment(target_db, table_name)
+        )
+        
+        if not columns:
+            return {
+                "status": "error",
+                "message": f"Table '{table_name}' not found in database '{target_db}'",
+                "table": table_name,
+                "database": target_db,
+                "columns": [],
+                "count": 0
+            }
+        
+        return _schema_result(table_name, target_db, columns, table_comment)
+                
+    except DB_ERRORS as e:
+        error_msg = _err("get_schema", database or db_name, e)
         return {
             "status": "error",
             "message": error_msg,
@@ -571,39 +1174,200 @@ async def get_schema(table_name: str, database: Optional[str] = None) -> Dict[st
             "count": 0
         }
 
+@mcp.tool()
+async def get_schemas(table_names: List[str], database: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get schema information for several tables at once.
+    Columns and table comments for all requested tables are read with one
+    query each, regardless of the number of tables.
+    
+    Args:
+        table_names: Names of the tables to describe
+        database: Database name containing the tables (required if no default database set)
+        
+    Returns:
+        List of per-table get_schema results in the order of table_names
+    """
+    target_db = database or db_name
+    if not target_db:
+        return {
+            "status": "error",
+            "message": "No database specified and no default database configured. Use 'database' parameter or set DB_NAME in environment.",
+            "database": None,
+            "schemas": [],
+            "count": 0
+        }
+    
+    tables = list(dict.fromkeys(table_names))
+    schemas: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for table in tables:
+        cached = _schema_cache.get((target_db, table))
+        if cached is not None and _schema_cache_fresh(cached[0]):
+            schemas[table] = cached[1]
+        else:
+            missing.append(table)
+    
+    if missing:
+        logger.info("🔍 Getting schema for %s tables in database: %s", len(missing), target_db)
+        placeholders = ",".join(["%s"] * len(missing))
+        args = (target_db, *missing)
+        
+        async def fetch(sql: str) -> List[Dict[str, Any]]:
+            async with _connection(target_db) as conn:
+                async with conn.cursor(aiomysql.DictCursor) as cursor:
+                    await cursor.execute(sql.format(tables=placeholders), args)
+                    return await cursor.fetchall()
+        
+        try:
+            column_rows, comment_rows = await asyncio.gather(
+                fetch(_SQL_SCHEMAS),
+                fetch(_SQL_TABLE_COMMENTS)
+            )
+        except DB_ERRORS as e:
+            error_msg = _err("get_schemas", target_db, e)
+            return {
+                "status": "error",
+                "message": error_msg,
+                "database": target_db,
+                "schemas": [],
+                "count": 0
+            }
+        
+        # Bucket rows per table in one pass; names are matched case-insensitively
+        # like MySQL does with lower_case_table_names=1/2
+        columns_by_table: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in column_rows:
+            columns_by_table[row["TABLE_NAME"].lower()].append(row)
+        comments = {row["TABLE_NAME"].lower(): row["TABLE_COMMENT"] for row in comment_rows}
+        
+        for table in missing:
+            columns = columns_by_table.get(table.lower())
+            if columns:
+                schemas[table] = _schema_result(table, target_db, columns, comments.get(table.lower(), ""))
+            else:
+                schemas[table] = {
+                    "status": "error",
+                    "message": f"Table '{table}' not found in database '{target_db}'",
+                    "table": table,
+                    "database": target_db,
+                    "columns": [],
+                    "count": 0
+                }
+    
+    results = [schemas[table] for table in tables]
+    failed = sum(1 for schema in results if schema["status"] != "success")
+    
+    return {
+        "status": "success" if failed == 0 else "error",
+        "message": f"Retrieved {len(results) - failed}/{len(results)} schemas",
+        "database": target_db,
+        "schemas": results,
+        "count": len(results)
+    }
+
+@mcp.tool()
+async def batch_query(queries: List[str], limit: int = 100, database: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Execute several independent SELECT queries concurrently.
+    Each query runs on its own pooled connection with the same rules as query_data.
+    
+    Args:
+        queries: SQL queries to execute
+        limit: Maximum number of rows to return per query (default: 100)
+        database: Optional database name to use for these queries (uses current if not specified)
+        
+    Returns:
+        List of per-query query_data results in the order of queries
+    """
+    logger.info("🔍 Executing %s queries concurrently", len(queries))
+    results = await asyncio.gather(*[query_data(query, limit=limit, database=database) for query in queries])
+    
+    return {
+        "success": all(result["success"] for result in results),
+        "results": list(results),
+        "count": len(results)
+    }
+
 # === MCP RESOURCES ===
+STATUS_CACHE_TTL = 5.0  # seconds a healthy status is reused
+STATUS_ERROR_TTL = 1.0  # failures are cached briefly to avoid reconnect storms
+_status_cache: Tuple[float, float, str] = (0.0, 0.0, "")  # (checked_at, ttl, status)
+
 @mcp.resource("mysql://status")
 async def get_status() -> str:
     """Get MySQL server health status."""
+    global _status_cache
+    
+    checked_at, ttl, status = _status_cache
+    now = time.monotonic()
+    if status and now - checked_at < ttl:
+        return status
+    
     try:
-        async with get_context() as ctx:
-            async with ctx.pool.acquire() as conn:
-                async with conn.cursor() as cursor:
-                    await cursor.execute("SELECT 1")
-                    await cursor.fetchone()
-        return "✅ MySQL server is healthy and ready"
-    except Exception as e:
-        return f"❌ MySQL server error: {str(e)}"
+        async with _connection() as conn:
+            # Protocol-level COM_PING, no statement parse or cursor needed
+            await conn.ping(reconnect=True)
+        _status_cache = (now, STATUS_CACHE_TTL, "✅ MySQL server is healthy and ready")
+    except DB_ERRORS as e:
+        _status_cache = (now, STATUS_ERROR_TTL, f"❌ MySQL server error: {str(e)}")
+    return _status_cache[2]
+
+@mcp.resource("mysql://cache/clear")
+async def clear_cache_resource() -> str:
+    """Invalidate the query result cache."""
+    count = clear_query_cache()
+    return f"🧹 Query cache cleared ({count} entries)"
+
+TABLES_RESOURCE_TTL = 5.0  # seconds rendered mysql://tables text is served as-is
+# Rendered mysql://tables text per database: (rendered_at, tables cache timestamp, text)
+_tables_text_cache: Dict[str, Tuple[float, float, str]] = {}
 
 @mcp.resource("mysql://tables")
 async def get_tables_resource() -> str:
     """Get list of all database tables as text resource."""
+    # Clients poll resources in bursts - serve recent text without going
+    # through list_tables at all
+    cached_text = _tables_text_cache.get(db_name) if db_name else None
+    now = time.monotonic()
+    if cached_text is not None and now - cached_text[0] < TABLES_RESOURCE_TTL:
+        return cached_text[2]
+    
     try:
         result = await list_tables()
         if result["status"] == "success":
+            database = result["database"]
+            cached_tables = _tables_cache.get(database)
+            stamp = cached_tables[0] if cached_tables is not None else now
+            if cached_text is not None and cached_text[1] == stamp:
+                # Table list unchanged since the last render
+                _tables_text_cache[database] = (now, stamp, cached_text[2])
+                return cached_text[2]
+            
             tables = result.get("tables", [])
             if tables:
-                return "\n".join([f"📊 {table}" for table in tables])
+                text = "\n".join(map("📊 {}".format, tables))
             else:
-                return "📋 No tables found in database"
+                text = "📋 No tables found in database"
+            _tables_text_cache[database] = (now, stamp, text)
+            return text
         else:
             return f"❌ Error: {result['message']}"
+    except DB_ERRORS as e:
+        return f"❌ Failed to get tables: {str(e)}"
+
+# === MAIN EXECUTION ===
+def _cleanup_at_exit() -> None:
+    """Last-resort pool cleanup for pools the lifespan did not close."""
+    if not _pools:
+        return
+    try:
+        asyncio.run(cleanup_global_context())
     except Exception as e:
-        return f"❌ Failed to get tables: {str(e)}"# === MAIN EXECUTION ===
-if __name__ == "__main__":
-    import argparse
-    import signal
-    
+        logger.error("❌ Error during cleanup: %s", e)
+
+def main() -> None:
+    """Console entry point (mcp-server-mysql)."""
     parser = argparse.ArgumentParser(description="MySQL MCP Server")
     parser.add_argument(
         "--transport", 
@@ -620,41 +1384,52 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
-    # Setup signal handlers for graceful shutdown
-    def signal_handler(signum, frame):
-        logger.info("� Received shutdown signal, cleaning up...")
-        asyncio.create_task(cleanup_global_context())
-        exit(0)
+    # FastMCP owns the event loop, so shutdown must happen inside it: SIGTERM is
+    # turned into the same KeyboardInterrupt as Ctrl+C, the running tasks are
+    # cancelled and the lifespan closes the pools on their own loop.
+    # (uvicorn installs its own graceful handlers for SSE/HTTP.)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    atexit.register(_cleanup_at_exit)
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Optional libuv-based event loop - lower per-await overhead on every tool call
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("⚡ Using uvloop event loop")
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
     
-    logger.info("�🚀 Starting minimalist MySQL MCP server...")
-    logger.info(f"📊 Transport: {args.transport}")
-    logger.info(f"🔌 Port: {args.port}")
+    logger.info("🚀 Starting minimalist MySQL MCP server...")
+    logger.info("📊 Transport: %s", args.transport)
+    logger.info("🔌 Port: %s", args.port)
     
     try:
         if args.transport == "streamable-http":
             # Streamable HTTP transport for web integration
-            logger.info(f"🌐 Starting HTTP transport on 0.0.0.0:{args.port}...")
+            logger.info("🌐 Starting HTTP transport on 0.0.0.0:%s...", args.port)
             mcp.run(transport="streamable-http")
         elif args.transport == "sse":
             # SSE transport for real-time applications  
-            logger.info(f"📡 Starting SSE transport on 0.0.0.0:{args.port}...")
+            logger.info("📡 Starting SSE transport on 0.0.0.0:%s...", args.port)
             mcp.run(transport="sse")
         else:
             # STDIO transport for command-line tools (default)
             logger.info("📝 Starting STDIO transport...")
             mcp.run(transport="stdio")
     except KeyboardInterrupt:
-        logger.info("🛑 Server interrupted by user")
+        logger.info("🛑 Server interrupted, shutting down...")
+        if args.transport == "stdio":
+            # The stdio transport reads stdin in a worker thread that stays
+            # blocked until the client closes the pipe; interpreter shutdown
+            # would wait for it forever, so exit without joining it
+            _cleanup_at_exit()
+            logger.info("👋 MySQL MCP Server shutdown complete")
+            logging.shutdown()
+            os._exit(0)
     except Exception as e:
-        logger.error(f"❌ Server error: {e}")
+        logger.error("❌ Server error: %s", e)
     finally:
-        # Cleanup on exit
-        logger.info("🧹 Performing final cleanup...")
-        try:
-            asyncio.run(cleanup_global_context())
-        except Exception as e:
-            logger.error(f"❌ Error during cleanup: {e}")
         logger.info("👋 MySQL MCP Server shutdown complete")
+
+if __name__ == "__main__":
+    main()
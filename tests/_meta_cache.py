@@ -0,0 +1,41 @@
+"""
+Metadata cache shared by the test scripts.
+
+Several tests ask for the same database and table lists; within one run
+(e.g. a pytest session) the schema does not change, so successful
+list_databases / list_tables results are reused for a short TTL instead of
+querying MySQL again from every test.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+META_CACHE_TTL = 30.0  # seconds a cached metadata result is reused
+
+# (database, kind) -> (stored_at, tool result)
+_cache: Dict[Tuple[Optional[str], str], Tuple[float, Dict[str, Any]]] = {}
+_lock = asyncio.Lock()  # concurrent tests wait for one lookup instead of each running it
+
+async def _cached(key: Tuple[Optional[str], str], fetch) -> Dict[str, Any]:
+    """Return a fresh cached result for key, or fetch and cache it if successful."""
+    async with _lock:
+        entry = _cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < META_CACHE_TTL:
+            return entry[1]
+        result = await fetch()
+        if result["status"] == "success":
+            _cache[key] = (time.monotonic(), result)
+        return result
+
+async def cached_list_databases() -> Dict[str, Any]:
+    """list_databases() through the test metadata cache."""
+    from mysql_server import list_databases
+
+    return await _cached((None, "databases"), list_databases)
+
+async def cached_list_tables(db: str) -> Dict[str, Any]:
+    """list_tables(database=db) through the test metadata cache."""
+    from mysql_server import list_tables
+
+    return await _cached((db, "tables"), lambda: list_tables(database=db))
@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures for the MySQL MCP Server tests.
+
+The test scripts also run standalone (python tests/<file>.py, run_tests.py);
+under pytest all async tests share one event loop and one connection pool
+for the whole session instead of opening and closing a pool per module.
+"""
+
+import os
+import sys
+
+import pytest
+import pytest_asyncio
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session event loop, where the pool lives."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _close_pools():
+    """Close every pool the session opened, once, after the last test."""
+    yield
+    from mysql_server import cleanup_global_context
+    await cleanup_global_context()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mysql_ctx():
+    """MySQL context for the active database, shared by all tests that request it."""
+    from mysql_server import get_context
+    
+    async with get_context() as ctx:
+        yield ctx
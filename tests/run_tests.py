@@ -4,43 +4,48 @@ Test runner for MySQL MCP Server
 Runs all available tests and provides summary
 """
 
-import asyncio
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+TEST_TIMEOUT = 60
+
 def run_test(test_file):
-    """Run a single test file and return result"""
-    print(f"\n🧪 Running {test_file}...")
-    print("=" * 60)
-    
+    """Run a single test file and return (name, returncode, stdout, stderr)"""
     try:
         result = subprocess.run([
             sys.executable, 
             str(Path("tests") / test_file)
-        ], capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0:
-            print(f"✅ {test_file} PASSED")
-            if result.stdout:
-                # Show last few lines of output for summary
-                lines = result.stdout.strip().split('\n')
-                for line in lines[-3:]:
-                    if '🏁' in line or '✅' in line or 'completed' in line:
-                        print(f"   {line}")
-            return True
-        else:
-            print(f"❌ {test_file} FAILED")
-            if result.stderr:
-                print(f"Error: {result.stderr}")
-            return False
-            
+        ], capture_output=True, text=True, timeout=TEST_TIMEOUT)
+        return test_file, result.returncode, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
-        print(f"⏰ {test_file} TIMEOUT (60s)")
-        return False
+        return test_file, None, "", f"TIMEOUT ({TEST_TIMEOUT}s)"
     except Exception as e:
-        print(f"💥 {test_file} ERROR: {e}")
+        return test_file, None, "", f"ERROR: {e}"
+
+def report_test(test_file, returncode, stdout, stderr):
+    """Print the result of a single test and return True if it passed"""
+    print(f"\n🧪 {test_file}")
+    print("=" * 60)
+    
+    if returncode == 0:
+        print(f"✅ {test_file} PASSED")
+        if stdout:
+            # Show last few lines of output for summary
+            lines = stdout.strip().split('\n')
+            for line in lines[-3:]:
+                if '🏁' in line or '✅' in line or 'completed' in line:
+                    print(f"   {line}")
+        return True
+    elif returncode is None:
+        print(f"💥 {test_file} {stderr}")
+        return False
+    else:
+        print(f"❌ {test_file} FAILED")
+        if stderr:
+            print(f"Error: {stderr}")
         return False
 
 def main():
@@ -49,7 +54,7 @@ def main():
     print("=" * 60)
     
     # Change to project root directory
-    os.chdir(Path(__file__).parent)
+    os.chdir(Path(__file__).resolve().parent.parent)
     
     # Test files to run
     test_files = [
@@ -68,10 +73,15 @@ def main():
         print(f"⚠️  Missing test files: {', '.join(missing_tests)}")
         return False
     
-    # Run tests
-    results = []
-    for test_file in test_files:
-        results.append(run_test(test_file))
+    # Run tests - they are independent, so run them side by side; wall time is
+    # the slowest test instead of the sum. Each worker only waits on its own
+    # subprocess, so threads are enough.
+    print(f"\n🧪 Running {len(test_files)} tests in parallel...")
+    with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+        outcomes = list(executor.map(run_test, test_files))
+    
+    # executor.map keeps submission order, so the report follows test_files
+    results = [report_test(*outcome) for outcome in outcomes]
     
     # Summary
     print("\n" + "=" * 60)
@@ -10,22 +10,50 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from mysql_server import list_databases, change_database, list_tables, query_data, get_schema, cleanup_global_context
+from _meta_cache import cached_list_databases, cached_list_tables
+from mysql_server import change_database, list_tables, query_data, get_schema, cleanup_global_context, get_context
 
-async def test_database_operations():
+async def _prefetch_metadata(ctx, dbs):
+    """Load tables and columns of all given databases in one information_schema query.
+    
+    Returns {database: {table: [column, ...]}} with tables and columns in
+    server order, so discovery does not cost a round-trip per database/table.
+    """
+    metadata = {db: {} for db in dbs}
+    if not dbs:
+        return metadata
+    async with ctx.pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(
+                "SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA IN %s ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION",
+                (tuple(dbs),)
+            )
+            for schema, table, column in await cursor.fetchall():
+                metadata[schema].setdefault(table, []).append(column)
+    return metadata
+
+async def test_database_operations(mysql_ctx):
     """Test database switching functionality"""
+    import mysql_server
+    
     print("🧪 Testing Database Switching Functionality")
     print("=" * 50)
     
     # Test 1: List available databases
     print("\n1️⃣ Testing list_databases...")
-    databases_result = await list_databases()
+    databases_result = await cached_list_databases()
     print(f"📋 Available databases: {databases_result}")
     
-    if databases_result["status"] == "success" and databases_result["databases"]:
-        available_dbs = databases_result["databases"]
-        print(f"✅ Found {len(available_dbs)} databases: {', '.join(available_dbs)}")
-        
+    assert databases_result["status"] == "success" and databases_result["databases"], \
+        "No databases found or error occurred"
+    available_dbs = databases_result["databases"]
+    print(f"✅ Found {len(available_dbs)} databases: {', '.join(available_dbs)}")
+    
+    # change_database switches the process-wide active database - put it back
+    # so later tests (and modules) still run against the configured one
+    previous_db = mysql_server.db_name
+    try:
         # Test 2: Change database (if we have multiple databases)
         if len(available_dbs) > 1:
             target_db = available_dbs[0]  # Pick first available database
@@ -33,75 +61,166 @@ async def test_database_operations():
             
             change_result = await change_database(target_db)
             print(f"🔄 Change database result: {change_result}")
+            assert change_result["status"] == "success", change_result["message"]
+            print(f"✅ Successfully changed to database: {target_db}")
             
-            if change_result["status"] == "success":
-                print(f"✅ Successfully changed to database: {target_db}")
-                
-                # Test 3: List tables in new database
-                print(f"\n3️⃣ Testing list_tables in '{target_db}'...")
-                tables_result = await list_tables()
-                print(f"📊 Tables in {target_db}: {tables_result}")
-                
-                # Test 4: Per-query database specification
-                if len(available_dbs) > 1:
-                    other_db = available_dbs[1]
-                    print(f"\n4️⃣ Testing per-query database switch to '{other_db}'...")
-                    
-                    # List tables in different database without changing global context
-                    per_query_result = await list_tables(database=other_db)
-                    print(f"📊 Tables in {other_db} (per-query): {per_query_result}")
-                    
-                    # Test query with specific database
-                    print(f"\n5️⃣ Testing query_data with database parameter...")
-                    query_result = await query_data(
-                        "SELECT * FROM User", 
-                        limit=3, 
-                        database=other_db
-                    )
-                    print(f"🔍 Query result from {other_db}: {query_result}")
-                    
-                    # Test SHOW command with database parameter
-                    print(f"\n5️⃣b Testing SHOW TABLES with database parameter...")
-                    show_result = await query_data(
-                        "SHOW TABLES", 
-                        limit=5, 
-                        database=other_db
-                    )
-                    print(f"🔍 SHOW TABLES result from {other_db}: {show_result}")
-                    if show_result['success']:
-                        table_names = []
-                        for row in show_result['rows'][:5]:
-                            # Get table name from the row (key varies by database)
-                            table_name = list(row.values())[0] if row else None
-                            if table_name:
-                                table_names.append(table_name)
-                        print(f"📊 First 5 tables: {table_names}")
-                    else:
-                        print("📊 Error getting tables")
-        
-        # Test 6: Schema with database parameter
-        if available_dbs:
-            test_db = available_dbs[0]
-            tables_for_schema = await list_tables(database=test_db)
+            # Test 3: List tables in new database
+            print(f"\n3️⃣ Testing list_tables in '{target_db}'...")
+            tables_result = await list_tables()
+            print(f"📊 Tables in {target_db}: {tables_result}")
+            assert tables_result["status"] == "success" and tables_result["database"] == target_db, tables_result
+            
+            # Test 4: Per-query database specification
+            other_db = available_dbs[1]
+            print(f"\n4️⃣ Testing per-query database switch to '{other_db}'...")
+            
+            # List tables in different database without changing global context
+            per_query_result = await cached_list_tables(other_db)
+            print(f"📊 Tables in {other_db} (per-query): {per_query_result}")
+            assert per_query_result["status"] == "success", per_query_result["message"]
+            assert mysql_server.db_name == target_db, "Per-query database changed the active database"
+            
+            # Test query with specific database
+            print(f"\n5️⃣ Testing query_data with database parameter...")
+            query_result = await query_data(
+                "SELECT DATABASE() AS current_db", 
+                limit=3, 
+                database=other_db
+            )
+            print(f"🔍 Query result from {other_db}: {query_result}")
+            assert query_result["success"], query_result["error"]
+            assert query_result["rows"] == [{"current_db": other_db}], query_result["rows"]
             
-            if (tables_for_schema["status"] == "success" and 
-                tables_for_schema["tables"]):
-                
-                first_table = tables_for_schema["tables"][0]
-                print(f"\n6️⃣ Testing get_schema for '{first_table}' in '{test_db}'...")
-                
-                schema_result = await get_schema(first_table, database=test_db)
-                print(f"🏗️ Schema result: {schema_result}")
-    
-    else:
-        print("❌ No databases found or error occurred")
+            # Test SHOW command with database parameter
+            print(f"\n5️⃣b Testing SHOW TABLES with database parameter...")
+            show_result = await query_data(
+                "SHOW TABLES", 
+                limit=5, 
+                database=other_db
+            )
+            print(f"🔍 SHOW TABLES result from {other_db}: {show_result}")
+            assert show_result['success'], show_result['error']
+            # The limit is applied in SQL, query_data never returns more rows
+            assert len(show_result['rows']) <= 5, "query_data ignored limit=5 for SHOW TABLES"
+            table_names = []
+            for row in show_result['rows']:
+                # Get table name from the row (key varies by database)
+                table_name = list(row.values())[0] if row else None
+                if table_name:
+                    table_names.append(table_name)
+            print(f"📊 First 5 tables: {table_names}")
+    finally:
+        mysql_server.db_name = previous_db
+    
+    # Test 6: Schema with database parameter
+    test_db = available_dbs[0]
+    # Table discovery comes from the prefetched metadata; get_schema
+    # itself is still called directly as the tool under test
+    metadata = await _prefetch_metadata(mysql_ctx, available_dbs)
+    tables_for_schema = list(metadata.get(test_db, {}))
+    
+    if tables_for_schema:
+        first_table = tables_for_schema[0]
+        print(f"\n6️⃣ Testing get_schema for '{first_table}' in '{test_db}'...")
+        
+        schema_result = await get_schema(first_table, database=test_db)
+        print(f"🏗️ Schema result: {schema_result}")
+        
+        expected_columns = metadata[test_db][first_table]
+        assert schema_result["status"] == "success", schema_result["message"]
+        fields = [col["field"] for col in schema_result["columns"]]
+        assert fields == expected_columns, f"get_schema columns {fields} differ from information_schema {expected_columns}"
+        print(f"✅ get_schema matches information_schema ({len(fields)} columns)")
     
     print("\n🏁 Database switching tests completed!")
 
+class _SpyCursor:
+    """Cursor stand-in that records executed SQL and how rows were fetched."""
+    
+    description = (("TABLE_NAME",),)
+    
+    def __init__(self, calls):
+        self.calls = calls
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def mogrify(self, sql, args=None):
+        return sql % tuple(args) if args else sql
+    
+    async def execute(self, sql, args=None):
+        self.calls.append(("execute", sql, args))
+    
+    async def fetchall(self):
+        self.calls.append(("fetchall",))
+        return [("t1",), ("t2",)]
+    
+    async def fetchmany(self, size):
+        self.calls.append(("fetchmany", size))
+        return [("t1",), ("t2",)][:size]
+
+class _SpyPool:
+    """Pool stand-in handing out a single connection with _SpyCursor cursors."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def acquire(self):
+        pool = self
+        
+        class _Conn:
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc):
+                return False
+            
+            def cursor(self, cursor_class=None):
+                return _SpyCursor(pool.calls)
+        
+        return _Conn()
+
+async def test_show_tables_limit_on_the_wire():
+    """query_data must send the limit to MySQL instead of fetching everything and slicing."""
+    import mysql_server
+    
+    print("\n🕵️ Testing that SHOW TABLES / SELECT limits are pushed into SQL...")
+    spy = _SpyPool()
+    mysql_server._pools["spy_db"] = spy
+    try:
+        for sql in ("SHOW TABLES", "SELECT * FROM User"):
+            mysql_server.clear_query_cache()
+            spy.calls.clear()
+            result = await query_data(sql, limit=5, database="spy_db")
+            assert result["success"], result
+            
+            executed = [call for call in spy.calls if call[0] == "execute"]
+            assert len(executed) == 1, executed
+            _, sent_sql, sent_args = executed[0]
+            assert "LIMIT %s" in sent_sql and sent_args[-1] == 5, (sent_sql, sent_args)
+            assert ("fetchmany", 5) in spy.calls and ("fetchall",) not in spy.calls
+            print(f"✅ {sql!r} sent as {sent_sql!r} with {sent_args!r}")
+        
+        # A LIMIT written by the caller is sent as-is, but reading stops at limit
+        mysql_server.clear_query_cache()
+        spy.calls.clear()
+        result = await query_data("SELECT * FROM User LIMIT 100000000", limit=1, database="spy_db")
+        assert result["success"] and result["row_count"] == 1, result
+        assert ("fetchall",) not in spy.calls and all(call[1] <= 1 for call in spy.calls if call[0] == "fetchmany")
+        print("✅ Caller LIMIT above the limit is capped while reading")
+    finally:
+        mysql_server._pools.pop("spy_db", None)
+        mysql_server.clear_query_cache()
+
 async def main():
     """Main test function with proper cleanup."""
     try:
-        await test_database_operations()
+        await test_show_tables_limit_on_the_wire()
+        async with get_context() as ctx:
+            await test_database_operations(ctx)
     finally:
         # Cleanup global context to prevent connection warnings
         await cleanup_global_context()
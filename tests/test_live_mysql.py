@@ -7,169 +7,197 @@ Test script to verify MySQL MCP server functionality with real database connecti
 """
 
 import asyncio
+import functools
+import io
 import sys
 import os
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-async def test_database_connection():
+async def test_database_connection(mysql_ctx, log=print):
     """Test basic database connection."""
-    print("🔌 Testing Database Connection...")
-    try:
-        from mysql_server import get_context
-        
-        async with get_context() as ctx:
-            async with ctx.pool.acquire() as conn:
-                async with conn.cursor() as cursor:
-                    await cursor.execute("SELECT 1 as test_value")
-                    result = await cursor.fetchone()
-                    print(f"✅ Database connection successful: {result}")
-                    return True
-    except Exception as e:
-        print(f"❌ Database connection failed: {e}")
-        return False
+    log("🔌 Testing Database Connection...")
+    async with mysql_ctx.pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute("SELECT 1 as test_value")
+            result = await cursor.fetchone()
+    assert result == (1,), f"Unexpected SELECT 1 result: {result}"
+    log(f"✅ Database connection successful: {result}")
 
-async def test_list_tables():
+async def test_list_tables(log=print):
     """Test list_tables tool."""
-    print("\n📋 Testing list_tables tool...")
-    try:
-        from mysql_server import list_tables
-        
-        result = await list_tables()
-        print(f"📊 Tables result: {json.dumps(result, indent=2)}")
-        
-        if result["status"] == "success":
-            print(f"✅ Found {result['count']} tables")
-            if result["tables"]:
-                print("📋 Tables:")
-                for table in result["tables"][:5]:  # Show first 5 tables
-                    print(f"   - {table}")
-            return True
-        else:
-            print(f"❌ Failed to list tables: {result['message']}")
-            return False
-    except Exception as e:
-        print(f"❌ list_tables error: {e}")
-        return False
+    log("\n📋 Testing list_tables tool...")
+    from mysql_server import list_tables
+    
+    result = await list_tables()
+    log(f"📊 Tables result: {json.dumps(result, indent=2)}")
+    
+    assert result["status"] == "success", f"Failed to list tables: {result['message']}"
+    log(f"✅ Found {result['count']} tables")
+    if result["tables"]:
+        log("📋 Tables:")
+        for table in result["tables"][:5]:  # Show first 5 tables
+            log(f"   - {table}")
+
+async def _probe_first_table_columns():
+    """Return (table, [columns]) of the alphabetically first table in the active
+    database with one information_schema query, or (None, []) if it has no tables."""
+    from mysql_server import get_pool
+    
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(
+                "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = ("
+                "SELECT MIN(TABLE_NAME) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE()"
+                ") ORDER BY ORDINAL_POSITION"
+            )
+            rows = await cursor.fetchall()
+    if not rows:
+        return None, []
+    return rows[0][0], [column for _, column in rows]
 
-async def test_get_schema():
+async def test_get_schema(log=print):
     """Test get_schema tool."""
-    print("\n🔍 Testing get_schema tool...")
-    try:
-        from mysql_server import list_tables, get_schema
-        
-        # First get a table to test
-        tables_result = await list_tables()
-        if tables_result["status"] == "success" and tables_result["tables"]:
-            test_table = tables_result["tables"][0]
-            print(f"📊 Testing schema for table: {test_table}")
-            
-            result = await get_schema(test_table)
-            print(f"📋 Schema result: {json.dumps(result, indent=2)}")
-            
-            if result["status"] == "success":
-                print(f"✅ Schema retrieved for {test_table}")
-                print(f"📊 Found {result['count']} columns")
-                if result["columns"]:
-                    print("📋 Columns:")
-                    for col in result["columns"][:3]:  # Show first 3 columns
-                        print(f"   - {col['field']}: {col['type']}")
-                return True
-            else:
-                print(f"❌ Failed to get schema: {result['message']}")
-                return False
-        else:
-            print("⚠️ No tables found to test schema")
-            return False
-    except Exception as e:
-        print(f"❌ get_schema error: {e}")
-        return False
+    log("\n🔍 Testing get_schema tool...")
+    from mysql_server import get_schema
+    
+    # Pick a table and its expected columns in one metadata round-trip
+    test_table, expected_columns = await _probe_first_table_columns()
+    assert test_table, "No tables found to test schema"
+    log(f"📊 Testing schema for table: {test_table}")
+    
+    result = await get_schema(test_table)
+    log(f"📋 Schema result: {json.dumps(result, indent=2)}")
+    
+    assert result["status"] == "success", f"Failed to get schema: {result['message']}"
+    log(f"✅ Schema retrieved for {test_table}")
+    log(f"📊 Found {result['count']} columns")
+    if result["columns"]:
+        log("📋 Columns:")
+        for col in result["columns"][:3]:  # Show first 3 columns
+            log(f"   - {col['field']}: {col['type']}")
+    fields = [col["field"] for col in result["columns"]]
+    assert fields == expected_columns, f"Columns {fields} differ from information_schema {expected_columns}"
 
-async def test_query_data():
+async def test_query_data(log=print):
     """Test query_data tool."""
-    print("\n📊 Testing query_data tool...")
-    try:
-        from mysql_server import query_data
-        
-        # Test basic query
-        test_query = "SELECT 1 as test_col, 'Hello MySQL' as message"
-        print(f"🔍 Testing query: {test_query}")
-        
-        result = await query_data(test_query, limit=5)
-        print(f"📋 Query result: {json.dumps(result, indent=2, default=str)}")
-        
-        if result["success"]:
-            print(f"✅ Query executed successfully")
-            print(f"📊 Returned {result['row_count']} rows")
-            return True
-        else:
-            print(f"❌ Query failed: {result['error']}")
-            return False
-    except Exception as e:
-        print(f"❌ query_data error: {e}")
-        return False
+    log("\n📊 Testing query_data tool...")
+    from mysql_server import query_data
+    
+    # Test basic query
+    test_query = "SELECT 1 as test_col, 'Hello MySQL' as message"
+    log(f"🔍 Testing query: {test_query}")
+    
+    result = await query_data(test_query, limit=5)
+    log(f"📋 Query result: {json.dumps(result, indent=2, default=str)}")
+    
+    assert result["success"], f"Query failed: {result['error']}"
+    assert result["rows"] == [{"test_col": 1, "message": "Hello MySQL"}], result["rows"]
+    log(f"✅ Query executed successfully")
+    log(f"📊 Returned {result['row_count']} rows")
+
+class _NoAcquirePool:
+    """Pool stand-in that records every acquire attempt."""
+    
+    def __init__(self):
+        self.acquires = 0
+    
+    def acquire(self):
+        self.acquires += 1
+        raise AssertionError("blocked query acquired a connection")
 
-async def test_security_features():
+async def test_security_features(log=print):
     """Test security features."""
-    print("\n🔒 Testing Security Features...")
+    log("\n🔒 Testing Security Features...")
+    import mysql_server
+    from mysql_server import query_data
+    
+    # Write verbs are rejected by the statement check before query_data
+    # acquires a connection. The queries target a throwaway database whose
+    # registry entry is a spy, so concurrently running tests are unaffected.
+    spy = _NoAcquirePool()
+    mysql_server._pools["security_spy"] = spy
     try:
-        from mysql_server import query_data
-        
-        # Test 1: Try INSERT (should be blocked)
-        print("🚫 Testing INSERT blocking...")
-        result = await query_data("INSERT INTO dummy VALUES (1)", limit=5)
-        if not result["success"] and "Only SELECT queries" in result["error"]:
-            print("✅ INSERT queries properly blocked")
-        else:
-            print("❌ INSERT should be blocked")
-            return False
-        
-        # Test 2: Try UPDATE (should be blocked)
-        print("🚫 Testing UPDATE blocking...")
-        result = await query_data("UPDATE dummy SET id = 1", limit=5)
-        if not result["success"] and "Only SELECT queries" in result["error"]:
-            print("✅ UPDATE queries properly blocked")
-        else:
-            print("❌ UPDATE should be blocked")
-            return False
-        
-        # Test 3: Try DELETE (should be blocked)
-        print("🚫 Testing DELETE blocking...")
-        result = await query_data("DELETE FROM dummy", limit=5)
-        if not result["success"] and "Only SELECT queries" in result["error"]:
-            print("✅ DELETE queries properly blocked")
-        else:
-            print("❌ DELETE should be blocked")
-            return False
-        
-        return True
-    except Exception as e:
-        print(f"❌ Security test error: {e}")
-        return False
+        for verb, query in (
+            ("INSERT", "INSERT INTO dummy VALUES (1)"),
+            ("UPDATE", "UPDATE dummy SET id = 1"),
+            ("DELETE", "DELETE FROM dummy"),
+        ):
+            log(f"🚫 Testing {verb} blocking...")
+            result = await query_data(query, limit=5, database="security_spy")
+            assert not result["success"] and "Only SELECT queries" in result["error"], f"{verb} should be blocked"
+            log(f"✅ {verb} queries properly blocked")
+    finally:
+        mysql_server._pools.pop("security_spy", None)
+    
+    assert not spy.acquires, f"Blocked queries acquired a connection {spy.acquires} times"
+    log("✅ Blocked queries never touched the connection pool")
+
+async def test_executable_comments(log=print):
+    """MySQL runs /*! ... */ comments - they must not hide INTO or a second statement."""
+    log("\n🔒 Testing executable comment handling...")
+    from mysql_server import _classify_query, execute_write, query_data
+    
+    for query in (
+        "SELECT * /*!INTO OUTFILE '/tmp/x'*/ FROM users",
+        "SELECT 1 /*!; DROP TABLE users; SELECT 1 */ FROM dual",
+        "SELECT 1 /*M!100000 INTO @v */",
+        "SELECT 1; /*! DROP TABLE users */",
+    ):
+        assert _classify_query(query).exec_comment, query
+        result = await query_data(query, limit=5)
+        assert not result["success"] and "Executable comments" in result["error"], result
+        log(f"✅ Rejected {query!r}")
+    
+    result = await execute_write("DELETE FROM users WHERE id = 1 /*!; DROP TABLE users */")
+    assert not result["success"] and "Executable comments" in result["error"], result
+    
+    # Plain comments and comment markers inside strings are not executable
+    assert not _classify_query("SELECT '/*!' AS s /* note */ FROM dual").exec_comment
+    log("✅ Executable comments rejected, plain comments allowed")
 
-async def test_resources():
+async def test_resources(log=print):
     """Test MCP resources."""
-    print("\n📋 Testing MCP Resources...")
+    log("\n📋 Testing MCP Resources...")
+    from mysql_server import get_status, get_tables_resource
+    
+    # Test status resource
+    log("🔍 Testing mysql://status resource...")
+    status = await get_status()
+    log(f"📊 Status: {status}")
+    assert status.startswith("✅"), status
+    
+    # Test tables resource
+    log("🔍 Testing mysql://tables resource...")
+    tables = await get_tables_resource()
+    log(f"📋 Tables resource: {tables}")
+    assert not tables.startswith("❌"), tables
+
+# Tests run concurrently, so each one logs into its own buffer through the
+# `log` function it is given and the output is shown in order afterwards
+async def _run_buffered(test_name, test_func):
+    """Run one test with its output captured; returns (passed, log)."""
+    buffer = io.StringIO()
+    log = functools.partial(print, file=buffer)
     try:
-        from mysql_server import get_status, get_tables_resource
-        
-        # Test status resource
-        print("🔍 Testing mysql://status resource...")
-        status = await get_status()
-        print(f"📊 Status: {status}")
-        
-        # Test tables resource
-        print("🔍 Testing mysql://tables resource...")
-        tables = await get_tables_resource()
-        print(f"📋 Tables resource: {tables}")
-        
-        return True
+        await test_func(log)
+        passed = True
     except Exception as e:
-        print(f"❌ Resources test error: {e}")
-        return False
+        log(f"❌ {test_name} failed: {type(e).__name__}: {e}")
+        passed = False
+    return passed, buffer.getvalue()
+
+async def _with_ctx(test_func, log):
+    """Run a test taking the mysql_ctx fixture outside pytest."""
+    from mysql_server import get_context
+    
+    async with get_context() as ctx:
+        await test_func(ctx, log)
 
 async def run_all_tests():
     """Run all tests."""
@@ -177,24 +205,32 @@ async def run_all_tests():
     print("=" * 50)
     
     tests = [
-        ("Database Connection", test_database_connection),
+        ("Database Connection", lambda log: _with_ctx(test_database_connection, log)),
         ("List Tables", test_list_tables),
         ("Get Schema", test_get_schema),
         ("Query Data", test_query_data),
         ("Security Features", test_security_features),
+        ("Executable Comments", test_executable_comments),
         ("MCP Resources", test_resources),
     ]
     
-    results = []
+    # The tests are independent and share the connection pool - overlap their
+    # MySQL round-trips instead of running them one after another
+    raw = await asyncio.gather(
+        *(_run_buffered(test_name, test_func) for test_name, test_func in tests),
+        return_exceptions=True
+    )
     
-    for test_name, test_func in tests:
+    results = []
+    for (test_name, _), outcome in zip(tests, raw):
         print(f"\n{'='*20} {test_name} {'='*20}")
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
+        if isinstance(outcome, BaseException):
+            print(f"❌ {test_name} failed with exception: {outcome}")
             results.append((test_name, False))
+        else:
+            passed_test, log = outcome
+            print(log, end="")
+            results.append((test_name, passed_test))
     
     # Summary
     print("\n" + "=" * 50)
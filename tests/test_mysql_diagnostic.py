@@ -14,79 +14,66 @@ import os
 # Add parent directory to path to import mysql_server
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-async def test_import():
+# Imported once for all tests; a failure is reported by test_import instead of
+# aborting the whole script
+try:
+    import mysql_server as _srv
+    _import_error = None
+except ImportError as e:
+    _srv = None
+    _import_error = e
+
+async def test_import(srv=_srv):
     """Test if server imports correctly."""
-    try:
-        print("🧪 Testing MySQL MCP Server imports...")
-        
-        # Test basic imports
-        import mysql_server
-        print("✅ Successfully imported mysql_server")
-        
-        # Test FastMCP import
-        from mcp.server.fastmcp import FastMCP
-        print("✅ FastMCP import successful")
-        
-        # Test aiomysql import
-        import aiomysql
-        print("✅ aiomysql import successful")
-        
-        # Test server instance
-        mcp_instance = mysql_server.mcp
-        print(f"✅ MCP server instance created: {mcp_instance}")
-        
-        print("\n🎉 All basic imports successful!")
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("💡 Make sure to install dependencies: pip install fastmcp aiomysql python-dotenv")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        return False
+    print("🧪 Testing MySQL MCP Server imports...")
+    
+    # Test basic imports
+    assert srv is not None, (
+        f"Import error: {_import_error} - install dependencies: pip install fastmcp aiomysql python-dotenv"
+    )
+    print("✅ Successfully imported mysql_server")
+    
+    # Test FastMCP import
+    from mcp.server.fastmcp import FastMCP
+    print("✅ FastMCP import successful")
+    
+    # Test aiomysql import
+    import aiomysql
+    print("✅ aiomysql import successful")
+    
+    # Test server instance
+    mcp_instance = srv.mcp
+    assert isinstance(mcp_instance, FastMCP), mcp_instance
+    print(f"✅ MCP server instance created: {mcp_instance}")
+    
+    print("\n🎉 All basic imports successful!")
 
-async def test_configuration():
+async def test_configuration(srv=_srv):
     """Test environment configuration loading."""
-    try:
-        print("\n⚙️ Testing configuration...")
-        
-        import mysql_server
-        
-        # Check if environment variables are loaded
-        print(f"📍 DB_HOST: {mysql_server.db_host}")
-        print(f"📍 DB_PORT: {mysql_server.db_port}")
-        print(f"📍 DB_USER: {mysql_server.db_user}")
-        print(f"📍 DB_NAME: {mysql_server.db_name}")
-        print(f"📍 DEBUG_MODE: {mysql_server.debug_mode}")
-        
-        print("✅ Configuration loaded successfully!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Configuration error: {e}")
-        return False
+    print("\n⚙️ Testing configuration...")
+    
+    assert srv is not None, f"mysql_server not importable: {_import_error}"
+    
+    # Check if environment variables are loaded
+    cfg = srv.CFG
+    print(f"📍 DB_HOST: {cfg.host}")
+    print(f"📍 DB_PORT: {cfg.port}")
+    print(f"📍 DB_USER: {cfg.user}")
+    print(f"📍 DB_NAME: {cfg.database}")
+    print(f"📍 DEBUG_MODE: {cfg.debug}")
+    assert cfg.host and 0 < cfg.port < 65536, cfg
+    
+    print("✅ Configuration loaded successfully!")
 
-async def test_server_without_db():
+async def test_server_without_db(srv=_srv):
     """Test server startup without database connection."""
-    try:
-        print("\n🚀 Testing server startup (without DB)...")
-        
-        import mysql_server
-        
-        # Check if server instance exists
-        if hasattr(mysql_server, 'mcp'):
-            print("✅ MCP server instance exists")
-        else:
-            print("❌ MCP server instance not found")
-            return False
-            
-        print("✅ Server can start without database!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Server startup error: {e}")
-        return False
+    print("\n🚀 Testing server startup (without DB)...")
+    
+    # Check if server instance exists
+    assert srv is not None and hasattr(srv, 'mcp'), "MCP server instance not found"
+    print("✅ MCP server instance exists")
+    
+    print("✅ Server can start without database!")
 
 async def main():
     """Run all diagnostic tests."""
@@ -99,15 +86,13 @@ async def main():
         ("Server Startup", test_server_without_db),
     ]
     
-    results = []
+    raw = await asyncio.gather(*(test_func(_srv) for _, test_func in tests), return_exceptions=True)
     
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} failed with exception: {e}")
-            results.append((test_name, False))
+    results = []
+    for (test_name, _), result in zip(tests, raw):
+        if isinstance(result, BaseException):
+            print(f"❌ {test_name} failed: {type(result).__name__}: {result}")
+        results.append((test_name, not isinstance(result, BaseException)))
     
     # Summary
     print("\n" + "=" * 40)
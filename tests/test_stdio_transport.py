@@ -4,29 +4,56 @@ Test STDIO transport for MySQL MCP Server
 Verifies that the server correctly uses stdin/stdout/stderr
 """
 
-import subprocess
+import asyncio
 import json
 import sys
-import time
 
-def test_stdio_transport():
+RESPONSE_TIMEOUT = 5.0  # seconds to wait for the initialize response
+STDERR_EXCERPT = 500  # bytes of server logs to show
+# MCP stdio framing is one JSON-RPC message per line (no Content-Length
+# headers); allow lines well above asyncio's 64 KiB default
+MAX_MESSAGE_SIZE = 4 * 1024 * 1024
+
+async def _read_message(stream):
+    """Read one newline-delimited message as raw bytes (b"" on EOF).
+    
+    Blank lines are skipped; json.loads parses the bytes directly, so no
+    text-mode decoding is involved.
+    """
+    while True:
+        line = await stream.readline()
+        if not line or line.strip():
+            return line
+
+async def _drain(stream, buf, limit):
+    """Keep reading stderr in the background, keeping the first `limit` bytes.
+    
+    Reading continuously also stops a chatty server from blocking on a full
+    stderr pipe before it answers.
+    """
+    while True:
+        chunk = await stream.read(4096)
+        if not chunk:
+            return
+        if len(buf) < limit:
+            buf.extend(chunk[:limit - len(buf)])
+
+async def test_stdio_transport():
     """Test that server responds correctly via STDIO."""
     print("🧪 Testing STDIO transport...")
     
     # Start the server process
-    process = subprocess.Popen(
-        [sys.executable, "mysql_server.py"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "mysql_server.py",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=MAX_MESSAGE_SIZE
     )
+    stderr_buf = bytearray()
+    drain_task = asyncio.create_task(_drain(process.stderr, stderr_buf, STDERR_EXCERPT))
     
     try:
-        # Give server time to start
-        time.sleep(2)
-        
         # Send MCP initialize request
         initialize_request = {
             "jsonrpc": "2.0",
@@ -42,38 +69,37 @@ def test_stdio_transport():
             }
         }
         
-        # Write to stdin
+        # Write to stdin right away - the request waits in the pipe until the
+        # server is ready, so no fixed start-up sleep is needed
         request_str = json.dumps(initialize_request) + "\n"
-        process.stdin.write(request_str)
-        process.stdin.flush()
-        
-        # Read from stdout (with timeout)
-        process.stdout.flush()
-        response_line = process.stdout.readline()
+        process.stdin.write(request_str.encode())
+        await process.stdin.drain()
         
-        if response_line:
-            print("✅ Server responded via stdout")
-            try:
-                response = json.loads(response_line)
-                print(f"📦 Response: {json.dumps(response, indent=2)}")
-            except json.JSONDecodeError:
-                print(f"⚠️  Response is not JSON: {response_line}")
-        else:
-            print("❌ No response from server")
+        # Read exactly one framed response from stdout (with timeout)
+        try:
+            response_line = await asyncio.wait_for(_read_message(process.stdout), timeout=RESPONSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            response_line = b""
         
-        # Check stderr for logs
-        stderr_output = process.stderr.read()
-        if stderr_output:
+        # Check stderr for logs - whatever the background drain has collected;
+        # the server keeps stderr open, so there is nothing to wait for
+        if stderr_buf:
             print("\n📋 Server logs (stderr):")
-            print(stderr_output[:500])  # First 500 chars
+            print(stderr_buf.decode(errors="replace"))  # First 500 bytes
         
-        print("\n✅ STDIO transport test completed")
+        assert response_line, "No response from server"
+        print("✅ Server responded via stdout")
+        response = json.loads(response_line)
+        print(f"📦 Response: {json.dumps(response, indent=2)}")
+        assert response.get("id") == 1 and "serverInfo" in response.get("result", {}), response
         
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
+        print("\n✅ STDIO transport test completed")
+    
     finally:
-        process.terminate()
-        process.wait(timeout=5)
+        drain_task.cancel()
+        if process.returncode is None:
+            process.terminate()
+        await asyncio.wait_for(process.wait(), timeout=5)
 
 if __name__ == "__main__":
-    test_stdio_transport()
+    asyncio.run(test_stdio_transport())